@@ -0,0 +1,94 @@
+"""
+Throughput and latency of per-request enforce() versus MicroBatcher under concurrent bursts.
+
+Run from the repository root:
+    python benchmarks/bench_batching.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gtaf_runtime import MicroBatcher, enforce  # noqa: E402
+
+SCOPE = "bench.prod"
+WINDOW = {"valid_from": "2026-01-01T00:00:00Z", "valid_until": "2099-01-01T00:00:00Z"}
+RB_COUNT = 300
+CONCURRENCY = 200
+BURSTS = 50
+
+
+def _build() -> tuple[dict, dict, list[dict]]:
+    artifacts = {
+        "SB-1": {
+            "scope": SCOPE,
+            "included_components": ["agent"],
+            "excluded_components": [],
+            "allowed_interfaces": ["api"],
+            **WINDOW,
+        },
+        "DR-1": {"scope": SCOPE, "decisions": ["act"], "delegation_mode": "AUTONOMOUS", **WINDOW},
+    }
+    rb_ids = [f"RB-{index:04d}" for index in range(RB_COUNT)]
+    for rb_id in rb_ids:
+        artifacts[rb_id] = {"scope": SCOPE, "active": True, **WINDOW}
+    drc = {
+        "id": "DRC-BENCH",
+        "revision": 1,
+        "result": "PERMITTED",
+        "gtaf_ref": {"version": "0.1"},
+        "scope": SCOPE,
+        "refs": {"sb": ["SB-1"], "dr": ["DR-1"], "rb": rb_ids},
+        **WINDOW,
+    }
+    contexts = [
+        {"scope": SCOPE, "component": "agent", "interface": "api", "action": "act" if index % 4 else "other"}
+        for index in range(CONCURRENCY)
+    ]
+    return drc, artifacts, contexts
+
+
+async def _run(label: str, call) -> None:
+    drc, _, contexts = _build()
+    latencies: list[float] = []
+
+    async def request(context: dict, arrived: float) -> None:
+        await call(drc, context)
+        latencies.append(time.perf_counter() - arrived)
+
+    started = time.perf_counter()
+    for _ in range(BURSTS):
+        # All requests of a burst arrive together; latency includes time spent queued behind others.
+        arrived = time.perf_counter()
+        await asyncio.gather(*(request(context, arrived) for context in contexts))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    total = BURSTS * CONCURRENCY
+    print(
+        f"{label:<12} {total / elapsed:12,.0f} req/s"
+        f"   p50 {statistics.median(latencies) * 1e3:7.2f} ms"
+        f"   p99 {latencies[int(len(latencies) * 0.99)] * 1e3:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    _, artifacts, _ = _build()
+
+    async def direct(drc: dict, context: dict):
+        return enforce(drc, context, artifacts)
+
+    batcher = MicroBatcher(artifacts)
+    print(f"{CONCURRENCY} concurrent requests per burst, {BURSTS} bursts, DRC with {RB_COUNT + 2} refs")
+    await _run("per-request", direct)
+    await _run("batched", batcher.enforce)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Resident size of a large artifact universe as parsed JSON dicts versus `compact_artifacts()`,
+and enforce() latency against each.
+
+Run from the repository root:
+    python benchmarks/bench_compact_memory.py
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gtaf_runtime import compact_artifacts, enforce  # noqa: E402
+
+SCOPES = 200
+PER_SCOPE = 250  # SB, DR and RB artifacts each, per scope
+WINDOWS = [
+    {"valid_from": f"2026-{month:02d}-01T00:00:00Z", "valid_until": "2099-01-01T00:00:00Z"} for month in range(1, 13)
+]
+ITERATIONS = 20_000
+
+
+def _build_json() -> str:
+    artifacts = {}
+    for scope_index in range(SCOPES):
+        scope = f"org.unit{scope_index:03d}.prod"
+        linked = [f"org.unit{(scope_index + 1) % SCOPES:03d}.prod"]
+        for index in range(PER_SCOPE):
+            window = WINDOWS[index % len(WINDOWS)]
+            artifacts[f"SB-{scope_index:03d}-{index:04d}"] = {
+                "scope": scope,
+                "linked_scopes": linked,
+                "included_components": [f"agent{index % 8}", "worker"],
+                "excluded_components": [],
+                "allowed_interfaces": ["api", "cli"],
+                **window,
+            }
+            artifacts[f"DR-{scope_index:03d}-{index:04d}"] = {
+                "scope": scope,
+                "decisions": ["restart", "scale", f"op{index % 16}"],
+                "delegation_mode": "AUTONOMOUS",
+                **window,
+            }
+            artifacts[f"RB-{scope_index:03d}-{index:04d}"] = {"scope": scope, "active": index % 5 != 0, **window}
+    return json.dumps(artifacts)
+
+
+def _retained(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def _time_enforce(artifacts: Mapping[str, Any]) -> float:
+    drc = {
+        "id": "DRC-1",
+        "revision": 1,
+        "result": "PERMITTED",
+        "scope": "org.unit007.prod",
+        "valid_from": "2026-01-01T00:00:00Z",
+        "valid_until": "2099-01-01T00:00:00Z",
+        "gtaf_ref": {"version": "0.1"},
+        "refs": {"sb": ["SB-007-0001"], "dr": ["DR-007-0001"], "rb": ["RB-007-0001", "RB-007-0002"]},
+    }
+    context = {"scope": "org.unit007.prod", "component": "agent1", "interface": "api", "action": "scale"}
+    assert enforce(drc, context, artifacts).outcome == "EXECUTE"
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        enforce(drc, context, artifacts)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    text = _build_json()
+    plain, plain_bytes = _retained(lambda: json.loads(text))
+    compact, compact_bytes = _retained(lambda: compact_artifacts(json.loads(text)))
+    count = len(plain)
+
+    print(f"{count} artifacts")
+    print(f"{'form':<10} {'retained MiB':>13} {'bytes/artifact':>15} {'enforce µs':>11}")
+    for name, artifacts, size in (("dict", plain, plain_bytes), ("compact", compact, compact_bytes)):
+        print(f"{name:<10} {size / 2**20:>13.1f} {size / count:>15.0f} {_time_enforce(artifacts):>11.2f}")
+    print(f"reduction: {1 - compact_bytes / plain_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Per-call latency of enforce() over the contract fixtures, optionally against another git revision
+so a change to the evaluation path can be checked for regressions.
+
+Run from the repository root:
+    python benchmarks/bench_enforce.py
+    python benchmarks/bench_enforce.py --against <git-rev>
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURE_ROOT = ROOT / "contract_fixtures" / "v0.1"
+CASES = ("happy_execute", "deny_rb_required_missing", "deny_missing_reference", "deny_dr_mismatch")
+NUMBER = 50_000
+REPEAT = 10
+
+# Runs inside a fresh interpreter so each tree imports its own gtaf_runtime.
+_TIMER = """
+import json, sys, timeit
+from datetime import datetime
+sys.path.insert(0, sys.argv[1])
+from gtaf_runtime.enforce import evaluate
+results = {}
+for case_dir in json.loads(sys.argv[2]):
+    load = lambda name: json.load(open(f"{case_dir}/{name}", encoding="utf-8"))
+    drc, artifacts, context = load("drc.json"), load("artifacts.json"), load("context.json")
+    now = datetime.fromisoformat(load("expected.json")["now"].replace("Z", "+00:00"))
+    timer = timeit.Timer(lambda: evaluate(drc, context, artifacts, now=now))
+    results[case_dir] = min(timer.repeat(repeat=%d, number=%d)) / %d * 1e6
+print(json.dumps(results))
+""" % (REPEAT, NUMBER, NUMBER)
+
+
+def _time_tree(tree: Path, case_dirs: list[str]) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _TIMER, str(tree), json.dumps(case_dirs)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _export_revision(rev: str, target: Path) -> None:
+    archive = subprocess.run(["git", "archive", rev, "gtaf_runtime"], cwd=ROOT, check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(target)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--against", metavar="REV", help="git revision to compare the working tree with")
+    args = parser.parse_args()
+
+    case_dirs = [str(FIXTURE_ROOT / case) for case in CASES if (FIXTURE_ROOT / case).is_dir()]
+    current = _time_tree(ROOT, case_dirs)
+    baseline = None
+    if args.against:
+        with tempfile.TemporaryDirectory() as tmp:
+            _export_revision(args.against, Path(tmp))
+            baseline = _time_tree(Path(tmp), case_dirs)
+
+    header = f"{'case':<20} {'current µs':>11}"
+    if baseline is not None:
+        header += f" {args.against + ' µs':>14} {'change':>8}"
+    print(header)
+    for case_dir in case_dirs:
+        line = f"{Path(case_dir).name:<20} {current[case_dir]:>11.2f}"
+        if baseline is not None:
+            change = current[case_dir] / baseline[case_dir] - 1
+            line += f" {baseline[case_dir]:>14.2f} {change:>+8.1%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
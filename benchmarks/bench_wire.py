@@ -0,0 +1,76 @@
+"""
+Round-trip throughput of the binary wire codec against dataclasses.asdict + JSON.
+
+Run from the repository root:
+    python benchmarks/bench_wire.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from gtaf_runtime import EnforcementResult, enforce  # noqa: E402
+from gtaf_runtime.wire import (  # noqa: E402
+    request_from_bytes,
+    request_to_bytes,
+    result_from_bytes,
+    result_to_bytes,
+)
+
+CASE_DIR = ROOT / "contract_fixtures" / "v0.1" / "happy_execute"
+NUMBER = 20_000
+
+
+def _load(name: str) -> dict:
+    with (CASE_DIR / name).open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _report(label: str, func, payload_size: int) -> None:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+    print(f"{label:<28} {best * 1e6:8.2f} us/round-trip  {payload_size:6d} bytes  {1 / best:12,.0f} ops/s")
+
+
+def main() -> None:
+    drc = _load("drc.json")
+    context = _load("context.json")
+    now = datetime.fromisoformat(_load("expected.json")["now"].replace("Z", "+00:00"))
+    result = enforce(drc, context, _load("artifacts.json"), now=now)
+
+    assert result_from_bytes(result_to_bytes(result)) == result
+    assert request_from_bytes(request_to_bytes(drc, context)) == (drc, context)
+
+    def json_result() -> EnforcementResult:
+        return EnforcementResult(**json.loads(json.dumps(asdict(result))))
+
+    def wire_result() -> EnforcementResult:
+        return result_from_bytes(result_to_bytes(result))
+
+    def json_request() -> tuple[dict, dict]:
+        payload = json.loads(json.dumps({"drc": drc, "context": context}))
+        return payload["drc"], payload["context"]
+
+    def wire_request() -> tuple[dict, dict]:
+        return request_from_bytes(request_to_bytes(drc, context))
+
+    def evaluate_only() -> EnforcementResult:
+        return enforce(drc, context, _ARTIFACTS, now=now)
+
+    _ARTIFACTS = _load("artifacts.json")
+    _report("enforce() (reference)", evaluate_only, 0)
+    _report("result: asdict + json", json_result, len(json.dumps(asdict(result)).encode("utf-8")))
+    _report("result: wire", wire_result, len(result_to_bytes(result)))
+    _report("request: json", json_request, len(json.dumps({"drc": drc, "context": context}).encode("utf-8")))
+    _report("request: wire", wire_request, len(request_to_bytes(drc, context)))
+
+
+if __name__ == "__main__":
+    main()
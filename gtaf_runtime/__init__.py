@@ -1,13 +1,63 @@
-from .enforce import evaluate, get_supported_projection_versions, validate_drc_structure
+import importlib
+from typing import Any
+
+from .enforce import (
+    ProjectionPipeline,
+    evaluate,
+    get_supported_projection_versions,
+    register_projection_pipeline,
+    validate_drc_structure,
+)
+from .cache import CacheStats, CompiledDRCCache
+from .compact import ArtifactInterner, CompactArtifact, MemberList, compact_artifacts
+from .snapshot import ArtifactDirectoryLoader, ArtifactSnapshot, apply_patch, diff_snapshots, snapshot_hash
 from .types import EnforcementResult
 
 # Public runtime API: enforce. Keep evaluate as backwards-compatible alias.
 enforce = evaluate
 
+# Components that pull in heavy stdlib modules (asyncio, multiprocessing) are imported on first access,
+# so `import gtaf_runtime` stays as cheap as the core gate.
+_LAZY_EXPORTS = {
+    "MicroBatcher": ".batching",
+    "evaluate_batch": ".batching",
+    "ConsistentHashRouter": ".sharding",
+    "ShardedEnforcer": ".sharding",
+    "shard_artifacts": ".sharding",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "enforce",
     "evaluate",
     "validate_drc_structure",
     "get_supported_projection_versions",
+    "register_projection_pipeline",
+    "ProjectionPipeline",
     "EnforcementResult",
+    "ArtifactDirectoryLoader",
+    "ArtifactSnapshot",
+    "diff_snapshots",
+    "apply_patch",
+    "snapshot_hash",
+    "CompiledDRCCache",
+    "CacheStats",
+    "compact_artifacts",
+    "ArtifactInterner",
+    "CompactArtifact",
+    "MemberList",
+    "ConsistentHashRouter",
+    "ShardedEnforcer",
+    "shard_artifacts",
+    "evaluate_batch",
+    "MicroBatcher",
 ]
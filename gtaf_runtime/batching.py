@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Mapping, Sequence, Union
+
+from .enforce import UTC, _compile_drc, _evaluate_compiled, evaluate
+from .types import EnforcementResult
+
+ArtifactSource = Union[Mapping[str, Any], Callable[[], Mapping[str, Any]]]
+
+
+def evaluate_batch(
+    requests: Sequence[tuple[dict[str, Any], dict[str, Any]]],
+    artifacts: Mapping[str, Any],
+    *,
+    supported_versions: set[str] | None = None,
+    now: datetime | None = None,
+) -> list[EnforcementResult]:
+    """
+    Evaluate many (drc, context) pairs against one artifact set and one `now`.
+    Context-independent work (structure, refs, windows) runs once per distinct DRC object;
+    each request still gets the result `enforce()` would return for it.
+    """
+    ts = now or datetime.now(UTC)
+    compiled_by_drc: dict[int, Any] = {}
+    results: list[EnforcementResult] = []
+    for drc, context in requests:
+        key = id(drc)
+        if key not in compiled_by_drc:
+            try:
+                compiled_by_drc[key] = _compile_drc(drc, artifacts)
+            except Exception:
+                compiled_by_drc[key] = None
+        compiled = compiled_by_drc[key]
+        if compiled is None:
+            results.append(evaluate(drc, context, artifacts, supported_versions=supported_versions, now=ts))
+        else:
+            results.append(
+                _evaluate_compiled(compiled, context, artifacts, supported_versions=supported_versions, now=ts)
+            )
+    return results
+
+
+class MicroBatcher:
+    """
+    Queues concurrent `enforce()` calls on an asyncio loop and evaluates them as one batch,
+    flushed on the next loop tick (or after `max_delay` seconds), or as soon as `max_batch_size`
+    requests are waiting.
+    """
+
+    def __init__(
+        self,
+        artifacts: ArtifactSource,
+        *,
+        max_batch_size: int = 256,
+        max_delay: float = 0.0,
+        supported_versions: set[str] | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._artifacts = artifacts if callable(artifacts) else (lambda: artifacts)
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._supported_versions = supported_versions
+        self._pending: list[tuple[dict[str, Any], dict[str, Any], asyncio.Future[EnforcementResult]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+
+    async def enforce(self, drc: dict[str, Any], context: dict[str, Any]) -> EnforcementResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[EnforcementResult] = loop.create_future()
+        self._pending.append((drc, context, future))
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            if self._max_delay > 0:
+                self._flush_handle = loop.call_later(self._max_delay, self.flush)
+            else:
+                self._flush_handle = loop.call_soon(self.flush)
+        return await future
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            results = evaluate_batch(
+                [(drc, context) for drc, context, _ in pending],
+                self._artifacts(),
+                supported_versions=self._supported_versions,
+            )
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, _, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
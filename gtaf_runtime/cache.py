@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import copy
+import heapq
+import itertools
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Hashable, Mapping
+
+from .compact import CompactArtifact
+from .enforce import _compile_drc, _CompiledDRC, _evaluate_compiled, evaluate
+from .types import EnforcementResult
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes_used: int
+    max_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry:
+    __slots__ = ("key", "compiled", "size", "frequency", "priority")
+
+    def __init__(self, key: Hashable, compiled: _CompiledDRC, size: int) -> None:
+        self.key = key
+        self.compiled = compiled
+        self.size = size
+        self.frequency = 0
+        self.priority = 0.0
+
+
+class CompiledDRCCache:
+    """
+    Byte-budgeted cache of per-DRC derived state (validated structure, resolved refs, parsed windows).
+
+    Entries are keyed by DRC `(id, revision)` and reused only for an equal DRC whose referenced
+    artifacts are still the same objects in the mapping, with unchanged validity windows; otherwise
+    the entry is rebuilt. Entries do not keep the artifact mapping itself alive, and the artifacts
+    they do hold are counted in their size, so `max_bytes` bounds what the cache retains even
+    after the snapshot those artifacts came from has been replaced.
+    Eviction is GreedyDual-Size-Frequency: priority = clock + frequency / size, which keeps small,
+    frequently used DRCs and lets the clock age out entries that stopped being hit.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._max_bytes = max_bytes
+        self._entries: dict[Hashable, _Entry] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._clock = 0.0
+        self._bytes_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def evaluate(
+        self,
+        drc: dict[str, Any],
+        context: dict[str, Any],
+        artifacts: Mapping[str, dict[str, Any]],
+        *,
+        supported_versions: set[str] | None = None,
+        now: datetime | None = None,
+    ) -> EnforcementResult:
+        """Same contract as `enforce()`, reusing cached derived state for the DRC when possible."""
+        compiled = self._lookup(drc, artifacts)
+        if compiled is None:
+            return evaluate(drc, context, artifacts, supported_versions=supported_versions, now=now)
+        return _evaluate_compiled(compiled, context, artifacts, supported_versions=supported_versions, now=now)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes_used=self._bytes_used,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._bytes_used = 0
+
+    def _lookup(self, drc: dict[str, Any], artifacts: Mapping[str, dict[str, Any]]) -> _CompiledDRC | None:
+        key = _cache_key(drc)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.compiled.drc == drc and _still_resolves(entry.compiled, artifacts):
+                self._hits += 1
+                self._touch(entry)
+                return entry.compiled
+            self._misses += 1
+
+        try:
+            # Own a copy so later mutation of the caller's DRC cannot desynchronize the cached state.
+            compiled = _compile_drc(copy.deepcopy(drc), artifacts)
+        except Exception:
+            return None
+        size = _compiled_size(compiled)
+
+        with self._lock:
+            self._store(key, compiled, size)
+        return compiled
+
+    def _touch(self, entry: _Entry) -> None:
+        entry.frequency += 1
+        entry.priority = self._clock + entry.frequency / entry.size
+        heapq.heappush(self._heap, (entry.priority, next(self._sequence), entry.key))
+        if len(self._heap) > 4 * len(self._entries) + 64:
+            self._rebuild_heap()
+
+    def _store(self, key: Hashable, compiled: _CompiledDRC, size: int) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes_used -= previous.size
+        if size > self._max_bytes:
+            return
+        while self._bytes_used + size > self._max_bytes:
+            self._evict_one()
+
+        entry = _Entry(key, compiled, size)
+        self._entries[key] = entry
+        self._bytes_used += size
+        self._touch(entry)
+
+    def _evict_one(self) -> None:
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            # Skip heap records superseded by a later touch or a removed entry.
+            if entry is None or entry.priority != priority:
+                continue
+            del self._entries[key]
+            self._bytes_used -= entry.size
+            self._clock = priority
+            self._evictions += 1
+            return
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(entry.priority, next(self._sequence), key) for key, entry in self._entries.items()]
+        heapq.heapify(self._heap)
+
+
+def _cache_key(drc: Any) -> Hashable | None:
+    if not isinstance(drc, dict):
+        return None
+    key = (drc.get("id"), drc.get("revision"))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _still_resolves(compiled: _CompiledDRC, artifacts: Mapping[str, Any]) -> bool:
+    """True if `compiled` still gives `evaluate()`'s result against `artifacts`."""
+    if not compiled.structure_valid:
+        return True
+    refs = compiled.drc["refs"]
+    ref_ids = [*refs["sb"], *refs["dr"], *refs["rb"]]
+    if compiled.items is None:
+        return any(artifacts.get(ref_id) is None for ref_id in ref_ids)
+    # Other artifact fields are read live from the same objects; only the windows were pre-parsed.
+    items = [item for group in compiled.items for item in group]
+    for ref_id, item, (valid_from, valid_until) in zip(ref_ids, items, compiled.item_window_sources):
+        if artifacts.get(ref_id) is not item:
+            return False
+        if item.get("valid_from") != valid_from or item.get("valid_until") != valid_until:
+            return False
+    return True
+
+
+def _compiled_size(compiled: _CompiledDRC) -> int:
+    # Resolved artifacts are charged to every entry holding them: an entry keeps them alive even
+    # after the snapshot they came from has been replaced, so they must count against the budget.
+    size = sys.getsizeof(compiled) + sys.getsizeof(compiled.__dict__)
+    return size + approximate_size(
+        (
+            compiled.drc,
+            compiled.refs,
+            compiled.window,
+            compiled.items,
+            compiled.item_windows,
+            compiled.item_window_sources,
+        )
+    )
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximate deep size in bytes of a JSON-like object graph, counting shared objects once."""
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, (dict, CompactArtifact)):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence, TextIO
+
+from . import errors
+from .enforce import UTC, _parse_datetime, _within_window, get_supported_projection_versions, validate_drc_structure
+from .snapshot import ArtifactDirectoryLoader
+
+PARSE_ERROR = "PARSE_ERROR"
+
+# (location, path to read or None, inline JSON text or None)
+_Task = tuple[str, "str | None", "str | None"]
+# (location, [(cause, detail), ...]); an empty failure list means the DRC passed.
+_Outcome = tuple[str, list[tuple[str, str]]]
+
+_SUPPORTED_VERSIONS = frozenset(get_supported_projection_versions())
+
+_worker_artifact_windows: dict[str, Any] | None = None
+_worker_now: datetime = datetime.now(UTC)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="gtaf-runtime", description="GTAF runtime utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="validate DRC files before publishing",
+        description=(
+            "Validate DRCs from .json files (one DRC each), .jsonl streams (one DRC per line), "
+            "directories containing either, or '-' for JSONL on stdin."
+        ),
+    )
+    validate.add_argument("paths", nargs="+", help="files, directories, or '-' for stdin")
+    validate.add_argument("--artifacts", help="artifact JSON file or directory; checks that refs.sb/dr/rb resolve")
+    validate.add_argument("--now", help="reference time for expiry checks (ISO 8601, default: current time)")
+    validate.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPUs)")
+    validate.add_argument("--chunk-size", type=int, default=256, help="DRCs per worker task (default: 256)")
+    validate.add_argument("--summary-only", action="store_true", help="print only the grouped summary")
+
+    args = parser.parse_args(argv)
+    now = datetime.now(UTC)
+    if args.now is not None:
+        parsed = _parse_datetime(args.now)
+        if parsed is None or parsed.tzinfo is None:
+            parser.error(f"--now must be an ISO 8601 timestamp with timezone, got {args.now!r}")
+        now = parsed
+    if args.jobs < 1 or args.chunk_size < 1:
+        parser.error("--jobs and --chunk-size must be at least 1")
+
+    artifact_windows = None
+    if args.artifacts is not None:
+        try:
+            artifact_windows = _load_artifact_windows(Path(args.artifacts))
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot load artifacts: {exc}")
+
+    tasks = _iter_tasks(args.paths, sys.stdin)
+    return _run_validate(
+        tasks,
+        artifact_windows=artifact_windows,
+        now=now,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
+        out=sys.stdout,
+        summary_only=args.summary_only,
+    )
+
+
+def _run_validate(
+    tasks: Iterable[_Task],
+    *,
+    artifact_windows: dict[str, Any] | None,
+    now: datetime,
+    jobs: int,
+    chunk_size: int,
+    out: TextIO,
+    summary_only: bool,
+) -> int:
+    causes: Counter[str] = Counter()
+    checked = failed = 0
+
+    executor: Executor | None = None
+    if jobs == 1:
+        _init_worker(artifact_windows, now)
+        batches: Iterable[list[_Outcome]] = map(_check_chunk, _chunked(tasks, chunk_size))
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(artifact_windows, now))
+        batches = _bounded_map(executor, _check_chunk, _chunked(tasks, chunk_size), window=jobs * 4)
+
+    try:
+        for batch in batches:
+            for location, failures in batch:
+                checked += 1
+                if not failures:
+                    continue
+                failed += 1
+                causes.update({cause for cause, _ in failures})
+                if not summary_only:
+                    for cause, detail in failures:
+                        out.write(f"FAIL {location} {cause} {detail}\n")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    out.write(f"checked {checked} DRCs: {checked - failed} ok, {failed} failed\n")
+    for cause, count in sorted(causes.items(), key=lambda item: (-item[1], item[0])):
+        out.write(f"  {cause}: {count}\n")
+    out.flush()
+    return 1 if failed else 0
+
+
+def _iter_tasks(paths: Iterable[str], stdin: TextIO) -> Iterator[_Task]:
+    for raw in paths:
+        if raw == "-":
+            yield from _iter_jsonl("<stdin>", stdin)
+            continue
+        path = Path(raw)
+        files = [path]
+        if path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.suffix in {".json", ".jsonl"} and p.is_file())
+        for file_path in files:
+            if file_path.suffix != ".jsonl":
+                yield (str(file_path), str(file_path), None)
+                continue
+            try:
+                stream = file_path.open("r", encoding="utf-8")
+            except OSError:
+                # The worker's own read attempt reports it as PARSE_ERROR.
+                yield (str(file_path), str(file_path), None)
+                continue
+            with stream:
+                yield from _iter_jsonl(str(file_path), stream)
+
+
+def _iter_jsonl(label: str, stream: TextIO) -> Iterator[_Task]:
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield (f"{label}:{line_number}", None, line)
+
+
+def _chunked(tasks: Iterable[_Task], size: int) -> Iterator[list[_Task]]:
+    chunk: list[_Task] = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bounded_map(executor: Executor, fn: Callable[[Any], Any], items: Iterable[Any], *, window: int) -> Iterator[Any]:
+    """Like `executor.map`, but keeps at most `window` tasks in flight so input can be streamed."""
+    pending: deque[Any] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _load_artifact_windows(path: Path) -> dict[str, Any]:
+    if path.is_dir():
+        artifacts = ArtifactDirectoryLoader(path).snapshot.artifacts
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            artifacts = json.load(f)
+        if not isinstance(artifacts, dict):
+            raise ValueError(f"{path}: expected an object of artifact id -> artifact")
+    # Workers only need ids and validity windows, not full artifacts. enforce() treats a null
+    # artifact as missing and fails on any other non-object (recorded as None).
+    return {
+        artifact_id: (artifact.get("valid_from"), artifact.get("valid_until")) if isinstance(artifact, dict) else None
+        for artifact_id, artifact in artifacts.items()
+        if artifact is not None
+    }
+
+
+def _init_worker(artifact_windows: dict[str, Any] | None, now: datetime) -> None:
+    global _worker_artifact_windows, _worker_now
+    _worker_artifact_windows = artifact_windows
+    _worker_now = now
+
+
+def _check_chunk(chunk: list[_Task]) -> list[_Outcome]:
+    outcomes = []
+    for location, path, text in chunk:
+        try:
+            failures = _check_task(path, text)
+        except Exception as exc:
+            # One pathological DRC must not take down the rest of the batch.
+            failures = [(PARSE_ERROR, f"unexpected error: {exc!r}")]
+        outcomes.append((location, failures))
+    return outcomes
+
+
+def _check_task(path: str | None, text: str | None) -> list[tuple[str, str]]:
+    try:
+        if path is not None:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        drc = json.loads(text or "")
+    except (OSError, ValueError, RecursionError) as exc:
+        return [(PARSE_ERROR, str(exc))]
+
+    if not validate_drc_structure(drc):
+        return [(errors.INVALID_DRC_SCHEMA, "DRC does not match the Projection v0.1 structure")]
+
+    failures: list[tuple[str, str]] = []
+    if drc["gtaf_ref"]["version"] not in _SUPPORTED_VERSIONS:
+        failures.append((errors.UNSUPPORTED_GTAF_VERSION, f"gtaf_ref.version {drc['gtaf_ref']['version']}"))
+    cause = _window_failure(drc["valid_from"], drc["valid_until"])
+    if cause is not None:
+        failures.append((cause, f"drc window {drc['valid_from']}..{drc['valid_until']}"))
+
+    if _worker_artifact_windows is not None:
+        ref_ids = [(group, ref_id) for group in ("sb", "dr", "rb") for ref_id in drc["refs"][group]]
+        missing = [f"{group}:{ref_id}" for group, ref_id in ref_ids if ref_id not in _worker_artifact_windows]
+        if missing:
+            failures.append((errors.MISSING_REFERENCE, " ".join(missing)))
+        by_cause: dict[str, list[str]] = {}
+        for _, ref_id in ref_ids:
+            if ref_id not in _worker_artifact_windows:
+                continue
+            window = _worker_artifact_windows[ref_id]
+            cause = errors.INTERNAL_ERROR if window is None else _window_failure(*window)
+            if cause is not None:
+                by_cause.setdefault(cause, []).append(ref_id)
+        for cause, ids in by_cause.items():
+            failures.append((cause, "artifacts " + " ".join(ids)))
+    return failures
+
+
+def _window_failure(valid_from: Any, valid_until: Any) -> str | None:
+    """
+    Cause to report for a DRC or artifact window at `--now`, or None if it is open or has simply
+    not started yet (DRCs may be published ahead of their start date).
+    """
+    try:
+        if _within_window(valid_from, valid_until, _worker_now):
+            return None
+    except TypeError:
+        # enforce() cannot compare a timezone-naive window with its aware clock.
+        return errors.INTERNAL_ERROR
+    if _parse_datetime(valid_from) is not None:
+        end = _parse_datetime(valid_until)
+        if end is not None and _worker_now < end:
+            return None
+    # Already ended, or missing/unparseable, which enforce() also denies as EXPIRED.
+    return errors.EXPIRED
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+# Artifact fields with a dedicated slot. The membership lists among them are stored as shared
+# `MemberList`s, so the v0.1 checks see the `list` they expect.
+_SET_FIELDS = frozenset(
+    {"linked_scopes", "included_components", "excluded_components", "allowed_interfaces", "decisions"}
+)
+_FIELDS = ("scope", "valid_from", "valid_until", "delegation_mode", "active", *sorted(_SET_FIELDS))
+_FIELD_NAMES = frozenset(_FIELDS)
+
+
+class MemberList(list):
+    """
+    Read-only list of strings. It is still a `list` for the core's type checks, but it refuses
+    mutation so one copy can be shared by every artifact that carries the same entries.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("MemberList is read-only")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"MemberList({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_member_list, (tuple(self),))
+
+
+class CompactArtifact(Mapping):
+    """
+    Read-only, slot-backed artifact. Known fields live in slots (an unset slot means the field is
+    absent); any other fields are kept in a small overflow dict. `get()` behaves like `dict.get()`.
+    Construct one from a mapping of fields, or use `ArtifactInterner` to share equal values.
+    """
+
+    __slots__ = (*_FIELDS, "_extra")
+
+    def __init__(self, fields: Mapping[str, Any] | None = None) -> None:
+        extra: dict[str, Any] | None = None
+        for key, value in (fields or {}).items():
+            if key not in _FIELD_NAMES:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if key in _SET_FIELDS and type(value) is list and all(isinstance(entry, str) for entry in value):
+                value = _member_list(tuple(value))
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "_extra", extra)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in _FIELD_NAMES:
+            return getattr(self, key, default)
+        extra = self._extra
+        return default if extra is None else extra.get(key, default)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for field in _FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CompactArtifact is read-only")
+
+    def __repr__(self) -> str:
+        return f"CompactArtifact({dict(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_rebuild, (dict(self),))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict copy; `MemberList` fields come back as plain lists."""
+        return {key: list(value) if isinstance(value, MemberList) else value for key, value in self.items()}
+
+
+class ArtifactInterner:
+    """
+    Converts raw artifact dicts into `CompactArtifact`s, sharing one copy of every equal string and
+    membership list across all artifacts it has seen. Reuse one interner across loads to keep sharing
+    between them; drop it to release its tables.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._lists: dict[tuple[str, ...], MemberList] = {}
+
+    def compact(self, artifact: Any) -> Any:
+        """`CompactArtifact` for a dict artifact; anything else is returned unchanged."""
+        if not isinstance(artifact, dict):
+            return artifact
+        return CompactArtifact(
+            {
+                self._string(key) if isinstance(key, str) else key: self._value(key, value)
+                for key, value in artifact.items()
+            }
+        )
+
+    def compact_all(self, artifacts: Mapping[str, Any]) -> dict[str, Any]:
+        return {self._string(artifact_id): self.compact(artifact) for artifact_id, artifact in artifacts.items()}
+
+    def _value(self, key: str, value: Any) -> Any:
+        if isinstance(value, str):
+            return self._string(value)
+        if key in _SET_FIELDS and isinstance(value, list) and all(isinstance(entry, str) for entry in value):
+            members = tuple(self._string(entry) for entry in value)
+            shared = self._lists.get(members)
+            if shared is None:
+                shared = self._lists[members] = _member_list(members)
+            return shared
+        # Lists of anything else keep their list type, so type checks in the core see the original value.
+        return value
+
+    def _string(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+
+def compact_artifacts(artifacts: Mapping[str, Any], *, interner: ArtifactInterner | None = None) -> dict[str, Any]:
+    """Compact form of an artifact id -> artifact mapping, usable wherever `enforce()` takes artifacts."""
+    return (interner or ArtifactInterner()).compact_all(artifacts)
+
+
+_MISSING = object()
+
+
+def _member_list(entries: tuple[str, ...]) -> MemberList:
+    members = MemberList()
+    list.extend(members, entries)
+    return members
+
+
+def _rebuild(fields: dict[str, Any]) -> CompactArtifact:
+    # Pickle memoizes shared objects within one dump, so sharing survives sending a whole artifact mapping.
+    return CompactArtifact(fields)
@@ -1,18 +1,66 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from . import errors
 from .types import EnforcementResult
 
 PROJECTION_CONTRACT_VERSION = "0.1"
-_DEFAULT_SUPPORTED_PROJECTION_VERSIONS = frozenset({PROJECTION_CONTRACT_VERSION})
 UTC = timezone.utc
 
 
+Window = tuple["datetime | None", "datetime | None"]
+
+
+@dataclass(frozen=True)
+class _CompiledDRC:
+    """Context- and time-independent state derived from a DRC and an artifact set."""
+
+    drc: dict[str, Any]
+    refs: list[str]
+    structure_valid: bool
+    version: str | None
+    window: Window
+    # Resolved (sb, dr, rb) items, or None if any reference is missing.
+    items: tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]] | None
+    item_windows: tuple[Window, ...]
+    # Raw (valid_from, valid_until) values item_windows were parsed from.
+    item_window_sources: tuple[tuple[Any, Any], ...]
+
+
+# A projection check runs steps 3+ for one version and returns the first deny reason code, or None.
+ProjectionCheck = Callable[[dict[str, Any], dict[str, Any], Mapping[str, Any], datetime], "str | None"]
+
+
+@dataclass(frozen=True)
+class ProjectionPipeline:
+    version: str
+    check: ProjectionCheck
+
+
 def get_supported_projection_versions() -> set[str]:
-    return set(_DEFAULT_SUPPORTED_PROJECTION_VERSIONS)
+    return set(_PIPELINES)
+
+
+def register_projection_pipeline(pipeline: ProjectionPipeline) -> None:
+    """
+    Register the evaluation pipeline for a new Projection version.
+    Registered versions are immutable; Projection v0.1 is frozen.
+    """
+    global _PIPELINES
+    with _PIPELINES_LOCK:
+        if pipeline.version in _PIPELINES:
+            raise ValueError(f"projection pipeline {pipeline.version!r} is already registered")
+        _PIPELINES = MappingProxyType({**_PIPELINES, pipeline.version: pipeline})
+
+
+def _pipeline_registry() -> Mapping[str, ProjectionPipeline]:
+    # Replaced, never mutated, on registration: identity tells whether anything was registered since.
+    return _PIPELINES
 
 
 def validate_drc_structure(drc: dict[str, Any]) -> bool:
@@ -30,7 +78,6 @@ def evaluate(
     Deterministic GTAF-3 runtime gate.
     Returns EXECUTE only if all checks pass; otherwise DENY with the first failing reason.
     """
-    supported_versions = supported_versions or get_supported_projection_versions()
     ts = now or datetime.now(UTC)
 
     try:
@@ -50,7 +97,7 @@ def _evaluate_inner(
     drc: dict[str, Any],
     context: dict[str, Any],
     artifacts: dict[str, dict[str, Any]],
-    supported_versions: set[str],
+    supported_versions: set[str] | None,
     now: datetime,
 ) -> EnforcementResult:
     # 1) Parse & validate DRC instance.
@@ -61,69 +108,205 @@ def _evaluate_inner(
 
     # 2) Reference version binding.
     version = drc["gtaf_ref"]["version"]
-    if version not in supported_versions:
+    pipeline = _PIPELINES.get(version) if not supported_versions else _select_pipeline(version, supported_versions)
+    if pipeline is None:
         return _deny(drc, errors.UNSUPPORTED_GTAF_VERSION, refs=drc_refs)
 
+    # 3+) Version-specific checks.
+    reason_code = pipeline.check(drc, context, artifacts, now)
+    if reason_code is not None:
+        return _deny(drc, reason_code, refs=drc_refs)
+
+    return EnforcementResult(
+        outcome="EXECUTE",
+        drc_id=drc.get("id"),
+        revision=drc.get("revision"),
+        valid_until=drc.get("valid_until"),
+        reason_code=errors.OK,
+        refs=drc_refs,
+        details={},
+    )
+
+
+def _compile_drc(drc: dict[str, Any], artifacts: Mapping[str, dict[str, Any]]) -> _CompiledDRC:
+    """
+    Derive the reusable per-DRC state. Raises if derivation touches malformed input; callers then
+    fall back to `evaluate()` so that INTERNAL_ERROR keeps its first-failure position.
+    """
+    if not _validate_drc_schema(drc):
+        return _CompiledDRC(drc, _refs_from_drc(drc), False, None, (None, None), None, (), ())
+
+    refs = drc["refs"]
+    sb_items = _resolve_refs(refs["sb"], artifacts)
+    dr_items = _resolve_refs(refs["dr"], artifacts)
+    rb_items = _resolve_refs(refs["rb"], artifacts)
+    items = None
+    item_windows: tuple[Window, ...] = ()
+    item_window_sources: tuple[tuple[Any, Any], ...] = ()
+    if sb_items is not None and dr_items is not None and rb_items is not None:
+        items = (sb_items, dr_items, rb_items)
+        item_window_sources = tuple(
+            (item.get("valid_from"), item.get("valid_until")) for item in [*sb_items, *dr_items, *rb_items]
+        )
+        item_windows = tuple((_parse_datetime(start), _parse_datetime(end)) for start, end in item_window_sources)
+    return _CompiledDRC(
+        drc=drc,
+        refs=_refs_from_drc(drc),
+        structure_valid=True,
+        version=drc["gtaf_ref"]["version"],
+        window=_parse_window(drc),
+        items=items,
+        item_windows=item_windows,
+        item_window_sources=item_window_sources,
+    )
+
+
+def _evaluate_compiled(
+    compiled: _CompiledDRC,
+    context: dict[str, Any],
+    artifacts: Mapping[str, dict[str, Any]],
+    *,
+    supported_versions: set[str] | None = None,
+    now: datetime | None = None,
+) -> EnforcementResult:
+    """Equivalent to `evaluate(compiled.drc, context, artifacts, ...)` for the artifacts it was compiled against."""
+    drc = compiled.drc
+    ts = now or datetime.now(UTC)
+
+    try:
+        if not compiled.structure_valid:
+            return _deny(drc, errors.INVALID_DRC_SCHEMA, refs=list(compiled.refs))
+        pipeline = _select_pipeline(compiled.version, supported_versions)
+        if pipeline is None:
+            return _deny(drc, errors.UNSUPPORTED_GTAF_VERSION, refs=list(compiled.refs))
+        if pipeline is _PROJECTION_V0_1:
+            reason_code = _check_projection_v0_1_compiled(compiled, context, ts)
+        else:
+            reason_code = pipeline.check(drc, context, artifacts, ts)
+        if reason_code is not None:
+            return _deny(drc, reason_code, refs=list(compiled.refs))
+        return _execute(drc, list(compiled.refs))
+    except Exception:
+        return _deny(drc, errors.INTERNAL_ERROR, refs=_refs_from_drc(drc))
+
+
+def _select_pipeline(version: str, supported_versions: set[str] | None) -> ProjectionPipeline | None:
+    if not supported_versions:
+        return _PIPELINES.get(version)
+    if version not in supported_versions:
+        return None
+    # Explicitly supported versions without a registered pipeline keep Projection v0.1 semantics.
+    return _PIPELINES.get(version, _PROJECTION_V0_1)
+
+
+def _execute(drc: dict[str, Any], drc_refs: list[str]) -> EnforcementResult:
+    return EnforcementResult(
+        outcome="EXECUTE",
+        drc_id=drc.get("id"),
+        revision=drc.get("revision"),
+        valid_until=drc.get("valid_until"),
+        reason_code=errors.OK,
+        refs=drc_refs,
+        details={},
+    )
+
+
+# Projection v0.1 evaluation order is frozen; see docs/projection-v0.1.md.
+# Steps 3-5 are inlined so the registry adds a single call, not one per step.
+def _check_projection_v0_1(
+    drc: dict[str, Any],
+    context: dict[str, Any],
+    artifacts: Mapping[str, Any],
+    now: datetime,
+) -> str | None:
     # 3) Temporality for DRC itself.
     if not _within_window(drc.get("valid_from"), drc.get("valid_until"), now):
-        return _deny(drc, errors.EXPIRED, refs=drc_refs)
+        return errors.EXPIRED
 
     # 4) Binary gate.
     if drc["result"] != "PERMITTED":
-        return _deny(drc, errors.DRC_NOT_PERMITTED, refs=drc_refs)
+        return errors.DRC_NOT_PERMITTED
 
     # 5) Referential closure + temporal validity of referenced artifacts.
     sb_items = _resolve_refs(drc["refs"]["sb"], artifacts)
     dr_items = _resolve_refs(drc["refs"]["dr"], artifacts)
     rb_items = _resolve_refs(drc["refs"]["rb"], artifacts)
     if sb_items is None or dr_items is None or rb_items is None:
-        return _deny(drc, errors.MISSING_REFERENCE, refs=drc_refs)
-
+        return errors.MISSING_REFERENCE
     for item in [*sb_items, *dr_items, *rb_items]:
         if not _within_window(item.get("valid_from"), item.get("valid_until"), now):
-            return _deny(drc, errors.EXPIRED, refs=drc_refs)
+            return errors.EXPIRED
+
+    return _check_context_v0_1(drc, context, sb_items, dr_items, rb_items)
+
 
+def _check_projection_v0_1_compiled(compiled: _CompiledDRC, context: dict[str, Any], now: datetime) -> str | None:
+    """Steps 3+ of `_check_projection_v0_1`, reading windows and resolved refs from `compiled`."""
+    drc = compiled.drc
+    # 3) Temporality for DRC itself.
+    if not _window_contains(compiled.window, now):
+        return errors.EXPIRED
+
+    # 4) Binary gate.
+    if drc["result"] != "PERMITTED":
+        return errors.DRC_NOT_PERMITTED
+
+    # 5) Referential closure + temporal validity of referenced artifacts.
+    if compiled.items is None:
+        return errors.MISSING_REFERENCE
+    for window in compiled.item_windows:
+        if not _window_contains(window, now):
+            return errors.EXPIRED
+
+    sb_items, dr_items, rb_items = compiled.items
+    return _check_context_v0_1(drc, context, sb_items, dr_items, rb_items)
+
+
+def _check_context_v0_1(
+    drc: dict[str, Any],
+    context: dict[str, Any],
+    sb_items: list[dict[str, Any]],
+    dr_items: list[dict[str, Any]],
+    rb_items: list[dict[str, Any]],
+) -> str | None:
     # 6) Scope coherence.
     ctx_scope = context.get("scope")
     if not isinstance(ctx_scope, str) or not ctx_scope:
-        return _deny(drc, errors.SCOPE_LEAK, refs=drc_refs)
+        return errors.SCOPE_LEAK
     if ctx_scope != drc["scope"]:
-        return _deny(drc, errors.SCOPE_LEAK, refs=drc_refs)
+        return errors.SCOPE_LEAK
     for item in [*sb_items, *dr_items, *rb_items]:
         if not _scope_matches(ctx_scope, item):
-            return _deny(drc, errors.SCOPE_LEAK, refs=drc_refs)
+            return errors.SCOPE_LEAK
 
     # 7) SB scope check.
     component = context.get("component")
     interface = context.get("interface")
     if not _inside_system_boundary(sb_items[0], component=component, interface=interface):
-        return _deny(drc, errors.OUTSIDE_SB, refs=drc_refs)
+        return errors.OUTSIDE_SB
 
     # 8) DR action identity check.
     action = context.get("action")
     matched_dr = _match_decision_record(dr_items, action)
     if matched_dr is None:
-        return _deny(drc, errors.DR_MISMATCH, refs=drc_refs)
+        return errors.DR_MISMATCH
 
     # 9) RB presence rule for semi/autonomous execution.
     mode = matched_dr.get("delegation_mode")
     if mode in {"SEMI_AUTONOMOUS", "AUTONOMOUS"}:
         active_rb = any(bool(rb.get("active")) for rb in rb_items)
         if not active_rb:
-            return _deny(drc, errors.RB_REQUIRED, refs=drc_refs)
+            return errors.RB_REQUIRED
+    return None
 
-    return EnforcementResult(
-        outcome="EXECUTE",
-        drc_id=drc.get("id"),
-        revision=drc.get("revision"),
-        valid_until=drc.get("valid_until"),
-        reason_code="OK",
-        refs=drc_refs,
-        details={},
-    )
 
+_PROJECTION_V0_1 = ProjectionPipeline(version=PROJECTION_CONTRACT_VERSION, check=_check_projection_v0_1)
+
+_PIPELINES: Mapping[str, ProjectionPipeline] = MappingProxyType({PROJECTION_CONTRACT_VERSION: _PROJECTION_V0_1})
+_PIPELINES_LOCK = threading.Lock()
 
-def _resolve_refs(ids: list[str], artifacts: dict[str, dict[str, Any]]) -> list[dict[str, Any]] | None:
+
+def _resolve_refs(ids: list[str], artifacts: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]] | None:
     resolved: list[dict[str, Any]] = []
     for ref_id in ids:
         item = artifacts.get(ref_id)
@@ -181,6 +364,17 @@ def _within_window(valid_from: Any, valid_until: Any, now: datetime) -> bool:
     return start <= now < end
 
 
+def _parse_window(item: Any) -> Window:
+    return _parse_datetime(item.get("valid_from")), _parse_datetime(item.get("valid_until"))
+
+
+def _window_contains(window: Window, now: datetime) -> bool:
+    start, end = window
+    if start is None or end is None:
+        return False
+    return start <= now < end
+
+
 def _refs_from_drc(drc: dict[str, Any]) -> list[str]:
     refs = drc.get("refs")
     if not isinstance(refs, dict):
@@ -1,3 +1,4 @@
+OK = "OK"
 INVALID_DRC_SCHEMA = "INVALID_DRC_SCHEMA"
 UNSUPPORTED_GTAF_VERSION = "UNSUPPORTED_GTAF_VERSION"
 EXPIRED = "EXPIRED"
@@ -8,3 +9,18 @@ OUTSIDE_SB = "OUTSIDE_SB"
 DR_MISMATCH = "DR_MISMATCH"
 RB_REQUIRED = "RB_REQUIRED"
 INTERNAL_ERROR = "INTERNAL_ERROR"
+
+# Stable small-integer encoding of reason codes (e.g. for the wire format). Append-only.
+REASON_CODES = (
+    OK,
+    INVALID_DRC_SCHEMA,
+    UNSUPPORTED_GTAF_VERSION,
+    EXPIRED,
+    DRC_NOT_PERMITTED,
+    MISSING_REFERENCE,
+    SCOPE_LEAK,
+    OUTSIDE_SB,
+    DR_MISMATCH,
+    RB_REQUIRED,
+    INTERNAL_ERROR,
+)
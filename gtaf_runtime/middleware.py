@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+
+from . import errors
+from .batching import ArtifactSource, MicroBatcher
+from .cache import CompiledDRCCache
+from .enforce import _deny, evaluate
+from .types import EnforcementResult
+
+CONTEXT_HEADERS = {
+    "scope": "x-gtaf-scope",
+    "component": "x-gtaf-component",
+    "interface": "x-gtaf-interface",
+    "action": "x-gtaf-action",
+}
+SCOPE_KEY = "gtaf.enforcement"
+
+ContextExtractor = Callable[[Mapping[str, Any]], "dict[str, Any] | None"]
+DRCResolver = Callable[[dict[str, Any]], "dict[str, Any] | None"]
+BypassPredicate = Callable[[Mapping[str, Any]], bool]
+
+
+def context_from_asgi_headers(scope: Mapping[str, Any]) -> dict[str, Any] | None:
+    headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope.get("headers", [])}
+    context = {field: headers[header] for field, header in CONTEXT_HEADERS.items() if header in headers}
+    return context or None
+
+
+def context_from_wsgi_environ(environ: Mapping[str, Any]) -> dict[str, Any] | None:
+    context = {}
+    for field, header in CONTEXT_HEADERS.items():
+        value = environ.get("HTTP_" + header.upper().replace("-", "_"))
+        if value is not None:
+            context[field] = value
+    return context or None
+
+
+class EnforcementMiddleware:
+    """
+    ASGI middleware gating HTTP and WebSocket requests with `enforce()`. Deny by default: a request
+    without an extractable context or without a DRC is denied like any other failed check. Only
+    requests matching the opt-in `bypass` predicate (e.g. health checks) reach the app ungated.
+    Concurrent gated requests are evaluated together by a `MicroBatcher`; denied HTTP requests get a
+    JSON 403, denied WebSockets are closed, and allowed ones reach the app with the result under
+    `scope["gtaf.enforcement"]`.
+
+    The default extractor trusts the `x-gtaf-*` request headers, i.e. the client chooses its own
+    context. Use it only behind a trusted proxy that sets these headers and drops client-supplied ones;
+    otherwise pass an `extract_context` that derives the context from authenticated request state.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Awaitable[None]],
+        *,
+        artifacts: ArtifactSource,
+        drc_for: DRCResolver,
+        extract_context: ContextExtractor = context_from_asgi_headers,
+        bypass: BypassPredicate | None = None,
+        max_batch_size: int = 256,
+        max_delay: float = 0.0,
+        deny_status: int = 403,
+    ) -> None:
+        self.app = app
+        self.batcher = MicroBatcher(artifacts, max_batch_size=max_batch_size, max_delay=max_delay)
+        self._drc_for = drc_for
+        self._extract_context = extract_context
+        self._bypass = bypass
+        self._deny_status = deny_status
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope.get("type") not in {"http", "websocket"} or (self._bypass is not None and self._bypass(scope)):
+            await self.app(scope, receive, send)
+            return
+        context = self._extract_context(scope)
+        drc = self._drc_for(context) if context is not None else None
+        if drc is None:
+            result = _NO_DRC
+        else:
+            result = await self.batcher.enforce(drc, context)
+        if result.outcome != "EXECUTE":
+            if scope["type"] == "websocket":
+                # Closing before accept makes the server reject the handshake.
+                await send({"type": "websocket.close", "code": 1008})
+                return
+            status, headers, body = _deny_response(result, self._deny_status)
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app({**scope, SCOPE_KEY: result}, receive, send)
+
+
+class WSGIEnforcementMiddleware:
+    """
+    WSGI counterpart of `EnforcementMiddleware`, with the same deny-by-default rules and the same
+    trusted-proxy requirement for the default header extractor. WSGI has no event loop to batch on,
+    so each request is evaluated directly; pass a `CompiledDRCCache` to share per-DRC work across
+    requests instead.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Iterable[bytes]],
+        *,
+        artifacts: ArtifactSource,
+        drc_for: DRCResolver,
+        extract_context: ContextExtractor = context_from_wsgi_environ,
+        bypass: BypassPredicate | None = None,
+        cache: CompiledDRCCache | None = None,
+        deny_status: int = 403,
+    ) -> None:
+        self.app = app
+        self._artifacts = artifacts if callable(artifacts) else (lambda: artifacts)
+        self._drc_for = drc_for
+        self._extract_context = extract_context
+        self._bypass = bypass
+        self._evaluate = cache.evaluate if cache is not None else evaluate
+        self._deny_status = deny_status
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        if self._bypass is not None and self._bypass(environ):
+            return self.app(environ, start_response)
+        context = self._extract_context(environ)
+        drc = self._drc_for(context) if context is not None else None
+        if drc is None:
+            result = _NO_DRC
+        else:
+            result = self._evaluate(drc, context, self._artifacts())
+        if result.outcome != "EXECUTE":
+            status, headers, body = _deny_response(result, self._deny_status)
+            start_response(
+                f"{status} {HTTPStatus(status).phrase}",
+                [(name.decode("latin-1"), value.decode("latin-1")) for name, value in headers],
+            )
+            return [body]
+        environ[SCOPE_KEY] = result
+        return self.app(environ, start_response)
+
+
+# Requests without a context or without an applicable DRC are denied as lacking a valid DRC.
+_NO_DRC = _deny(None, errors.INVALID_DRC_SCHEMA, refs=[])
+
+
+def _deny_response(result: EnforcementResult, status: int) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    body = json.dumps(
+        {"outcome": result.outcome, "reason_code": result.reason_code, "drc_id": result.drc_id},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+    return status, headers, body
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import multiprocessing
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, Tuple, Union
+
+from . import errors
+from .enforce import (
+    PROJECTION_CONTRACT_VERSION,
+    ProjectionPipeline,
+    _deny,
+    _pipeline_registry,
+    _refs_from_drc,
+    evaluate,
+    register_projection_pipeline,
+)
+from .types import EnforcementResult
+
+ArtifactPairs = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+ShardSource = Union[Mapping[str, Any], Callable[[], ArtifactPairs]]
+
+
+class ConsistentHashRouter:
+    """Assigns scopes to shards on a hash ring with `replicas` virtual nodes per shard."""
+
+    def __init__(self, shard_ids: Sequence[str], *, replicas: int = 64) -> None:
+        if not shard_ids:
+            raise ValueError("at least one shard is required")
+        if len(set(shard_ids)) != len(shard_ids):
+            raise ValueError("shard ids must be unique")
+        ring = sorted(
+            (_hash(f"{shard_id}#{replica}"), shard_id) for shard_id in shard_ids for replica in range(replicas)
+        )
+        self.shard_ids = tuple(shard_ids)
+        self._points = [point for point, _ in ring]
+        self._owners = [shard_id for _, shard_id in ring]
+
+    def shard_for(self, scope: str) -> str:
+        index = bisect.bisect(self._points, _hash(scope)) % len(self._points)
+        return self._owners[index]
+
+    def shard_for_request(self, drc: Any, context: Any) -> str:
+        # Requests without a usable scope fail before scope-dependent checks, so any shard answers them.
+        for source in (drc, context):
+            scope = source.get("scope") if isinstance(source, dict) else None
+            if isinstance(scope, str) and scope:
+                return self.shard_for(scope)
+        return self.shard_ids[0]
+
+
+def shard_artifacts(artifacts: ArtifactPairs, shard_id: str, router: ConsistentHashRouter) -> Mapping[str, Any]:
+    """
+    Artifact set for one shard: full artifacts whose `scope` or any `linked_scopes` entry is owned by
+    the shard, and a window-only index for all other ids.
+
+    A request routed here has a scope owned by this shard, which no artifact outside the shard can
+    match. Under Projection v0.1 such a reference can therefore only fail with EXPIRED (step 5) or
+    SCOPE_LEAK (step 6), exactly as on a single node, and only its raw validity window is needed to
+    tell which. Other registered versions see the same view; it is exact for them only if they too
+    never read more than the validity window of an artifact outside the request scope.
+    """
+    local: dict[str, Any] = {}
+    windows: dict[str, tuple[Any, Any]] = {}
+    shared_windows: dict[tuple[Any, Any], tuple[Any, Any]] = {}
+    pairs = artifacts.items() if isinstance(artifacts, Mapping) else artifacts
+    for artifact_id, artifact in pairs:
+        if not isinstance(artifact, Mapping) or shard_id in _owning_shards(artifact, router):
+            local[artifact_id] = artifact
+            continue
+        window = (artifact.get("valid_from"), artifact.get("valid_until"))
+        try:
+            window = shared_windows.setdefault(window, window)
+        except TypeError:
+            pass
+        windows[artifact_id] = window
+    return _ShardArtifacts(local, windows)
+
+
+class _ShardArtifacts(Mapping):
+    """Shard-local artifacts, with remote ids answered by a window-only artifact built on lookup."""
+
+    __slots__ = ("_local", "_windows")
+
+    def __init__(self, local: dict[str, Any], windows: dict[str, tuple[Any, Any]]) -> None:
+        self._local = local
+        self._windows = windows
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        item = self._local.get(key, _MISSING)
+        if item is not _MISSING:
+            return item
+        window = self._windows.get(key)
+        if window is None:
+            return default
+        return {"valid_from": window[0], "valid_until": window[1]}
+
+    def __getitem__(self, key: Any) -> Any:
+        item = self.get(key, _MISSING)
+        if item is _MISSING:
+            raise KeyError(key)
+        return item
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._local
+        yield from self._windows
+
+    def __len__(self) -> int:
+        return len(self._local) + len(self._windows)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_ShardArtifacts, (self._local, self._windows))
+
+
+_MISSING = object()
+
+
+def _owning_shards(artifact: Mapping[str, Any], router: ConsistentHashRouter) -> set[str]:
+    scopes: list[Any] = [artifact.get("scope")]
+    linked = artifact.get("linked_scopes", [])
+    if isinstance(linked, list):
+        scopes.extend(linked)
+    return {router.shard_for(scope) for scope in scopes if isinstance(scope, str)}
+
+
+class ShardedEnforcer:
+    """
+    Runs one worker process per shard, each holding only its shard-local artifacts, and forwards
+    `enforce()` calls to the shard that owns the request scope. For Projection v0.1, results are
+    identical to calling `enforce()` against the full artifact set.
+
+    Pipelines registered with `register_projection_pipeline()` are forwarded to the workers,
+    including ones registered after start, so they must be picklable (module-level check
+    functions). They evaluate against the shard-local view described in `shard_artifacts()`.
+
+    `artifacts` is either the full mapping, partitioned here, or a picklable zero-argument callable
+    returning a mapping or (id, artifact) pairs; each worker then calls it and keeps only its share,
+    so this process never holds the full set. A shard that does not answer within `timeout` seconds,
+    or a request that cannot be sent, yields INTERNAL_ERROR.
+    """
+
+    def __init__(
+        self,
+        artifacts: ShardSource,
+        shard_ids: Iterable[str],
+        *,
+        replicas: int = 64,
+        timeout: float | None = 10.0,
+        mp_context: Any = None,
+    ) -> None:
+        self.router = ConsistentHashRouter(list(shard_ids), replicas=replicas)
+        self._timeout = timeout
+        self._request_ids = itertools.count()
+        ctx = mp_context or multiprocessing.get_context("spawn")
+        self._shards: dict[str, _Shard] = {}
+        registry = _pipeline_registry()
+        try:
+            for shard_id in self.router.shard_ids:
+                source = artifacts if callable(artifacts) else shard_artifacts(artifacts, shard_id, self.router)
+                parent, child = ctx.Pipe()
+                process = ctx.Process(
+                    target=_shard_worker,
+                    args=(child, source, shard_id, self.router, _registered_pipelines(registry)),
+                    name=f"gtaf-shard-{shard_id}",
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._shards[shard_id] = _Shard(process, parent, registry)
+            for shard_id, shard in self._shards.items():
+                connection = shard.connection
+                # Workers load in parallel; each reports once its artifacts are in place.
+                try:
+                    error = connection.recv()
+                except (OSError, EOFError):
+                    error = "worker exited during startup"
+                if error is not None:
+                    raise RuntimeError(f"shard {shard_id!r} failed to load artifacts: {error}")
+        except BaseException:
+            self.close()
+            raise
+
+    def enforce(
+        self,
+        drc: dict[str, Any],
+        context: dict[str, Any],
+        *,
+        supported_versions: set[str] | None = None,
+        now: datetime | None = None,
+    ) -> EnforcementResult:
+        shard = self._shards[self.router.shard_for_request(drc, context)]
+        connection = shard.connection
+        try:
+            with shard.lock:
+                registry = _pipeline_registry()
+                if shard.registry is not registry:
+                    connection.send(("pipelines", _registered_pipelines(registry)))
+                    shard.registry = registry
+                request_id = next(self._request_ids)
+                connection.send(("enforce", request_id, drc, context, supported_versions, now))
+                deadline = None if self._timeout is None else time.monotonic() + self._timeout
+                while deadline is None or connection.poll(max(deadline - time.monotonic(), 0)):
+                    reply_id, result = connection.recv()
+                    # Replies to requests that already timed out are dropped here.
+                    if reply_id == request_id:
+                        return result
+        except Exception:
+            pass
+        # An unreachable, hung or unsendable shard request must not turn into an implicit EXECUTE.
+        return _deny(drc, errors.INTERNAL_ERROR, refs=_refs_from_drc(drc))
+
+    def close(self) -> None:
+        for shard in self._shards.values():
+            with shard.lock:
+                try:
+                    shard.connection.send(None)
+                except OSError:
+                    pass
+                shard.connection.close()
+            shard.process.join(timeout=5)
+            if shard.process.is_alive():
+                shard.process.terminate()
+        self._shards.clear()
+
+    def __enter__(self) -> ShardedEnforcer:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _Shard:
+    __slots__ = ("process", "connection", "lock", "registry")
+
+    def __init__(self, process: Any, connection: Any, registry: Mapping[str, ProjectionPipeline]) -> None:
+        self.process = process
+        self.connection = connection
+        self.lock = threading.Lock()
+        # Pipeline registry the worker was last synchronized with.
+        self.registry = registry
+
+
+def _registered_pipelines(registry: Mapping[str, ProjectionPipeline]) -> list[ProjectionPipeline]:
+    return [pipeline for version, pipeline in registry.items() if version != PROJECTION_CONTRACT_VERSION]
+
+
+def _register_missing(pipelines: list[ProjectionPipeline]) -> None:
+    for pipeline in pipelines:
+        if pipeline.version not in _pipeline_registry():
+            register_projection_pipeline(pipeline)
+
+
+def _shard_worker(
+    connection: Any,
+    source: Any,
+    shard_id: str,
+    router: ConsistentHashRouter,
+    pipelines: list[ProjectionPipeline],
+) -> None:
+    try:
+        _register_missing(pipelines)
+        artifacts = shard_artifacts(source(), shard_id, router) if callable(source) else source
+    except Exception as exc:
+        connection.send(repr(exc))
+        return
+    connection.send(None)
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        if message[0] == "pipelines":
+            _register_missing(message[1])
+            continue
+        _, request_id, drc, context, supported_versions, now = message
+        result = evaluate(drc, context, artifacts, supported_versions=supported_versions, now=now)
+        try:
+            connection.send((request_id, result))
+        except OSError:
+            return
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from .compact import ArtifactInterner
+
+
+@dataclass(frozen=True)
+class ArtifactSnapshot:
+    generation: int
+    artifacts: Mapping[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class _FileEntry:
+    signature: tuple[int, int]
+    digest: str | None
+    artifacts: dict[str, Any]
+
+
+class ArtifactDirectoryLoader:
+    """
+    Loads a directory of artifact JSON files (each an object of artifact id -> artifact)
+    into immutable snapshots. Only changed files are re-parsed on refresh; the new snapshot
+    is published by a single reference swap, so readers of `snapshot` never take a lock.
+
+    With an `interner`, each file's artifacts are compacted as soon as it is parsed, so the raw
+    dicts of only one file are alive at a time. Sharing between files and refreshes lasts as long
+    as the interner does.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        pattern: str = "*.json",
+        use_content_hash: bool = False,
+        interner: ArtifactInterner | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._pattern = pattern
+        self._use_content_hash = use_content_hash
+        self._interner = interner
+        self._files: dict[str, _FileEntry] = {}
+        self._snapshot = ArtifactSnapshot(generation=0, artifacts=MappingProxyType({}))
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._poller: threading.Thread | None = None
+        self.last_error: Exception | None = None
+        self.refresh()
+
+    @property
+    def snapshot(self) -> ArtifactSnapshot:
+        return self._snapshot
+
+    def refresh(self) -> bool:
+        """
+        Rescan the directory and publish a new snapshot if any file was added, removed or changed.
+        On a parse error, duplicate artifact id or missing directory the previous snapshot stays published.
+        """
+        with self._refresh_lock:
+            if not self._path.is_dir():
+                if self._path.exists():
+                    raise NotADirectoryError(f"artifact path {self._path} is not a directory")
+                raise FileNotFoundError(f"artifact directory {self._path} does not exist")
+            entries: dict[str, _FileEntry] = {}
+            changed = False
+            for file_path in sorted(self._path.glob(self._pattern)):
+                if not file_path.is_file():
+                    continue
+                previous = self._files.get(file_path.name)
+                entry = self._load_entry(file_path, previous)
+                if previous is None or entry.artifacts is not previous.artifacts:
+                    changed = True
+                entries[file_path.name] = entry
+
+            if entries.keys() != self._files.keys():
+                changed = True
+            if changed:
+                merged = _merge_entries(entries)
+                self._snapshot = ArtifactSnapshot(
+                    generation=self._snapshot.generation + 1,
+                    artifacts=MappingProxyType(merged),
+                )
+            self._files = entries
+            return changed
+
+    def start(self, interval: float = 1.0) -> None:
+        if self._poller is not None:
+            return
+        self._stop.clear()
+        self._poller = threading.Thread(target=self._poll, args=(interval,), name="gtaf-artifact-poller", daemon=True)
+        self._poller.start()
+
+    def stop(self) -> None:
+        if self._poller is None:
+            return
+        self._stop.set()
+        self._poller.join()
+        self._poller = None
+
+    def _poll(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as exc:
+                self.last_error = exc
+
+    def _load_entry(self, file_path: Path, previous: _FileEntry | None) -> _FileEntry:
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if not self._use_content_hash:
+            if previous is not None and previous.signature == signature:
+                return previous
+            return _FileEntry(signature, None, self._parse(file_path, file_path.read_bytes()))
+
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if previous is not None and previous.digest == digest:
+            return _FileEntry(signature, digest, previous.artifacts)
+        return _FileEntry(signature, digest, self._parse(file_path, data))
+
+    def _parse(self, file_path: Path, data: bytes) -> dict[str, Any]:
+        artifacts = _parse_artifact_file(file_path, data)
+        return artifacts if self._interner is None else self._interner.compact_all(artifacts)
+
+
+def _parse_artifact_file(file_path: Path, data: bytes) -> dict[str, Any]:
+    try:
+        parsed = json.loads(data)
+    except ValueError as exc:
+        raise ValueError(f"{file_path.name}: invalid JSON: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError(f"{file_path.name}: expected an object of artifact id -> artifact")
+    return parsed
+
+
+def _merge_entries(entries: dict[str, _FileEntry]) -> dict[str, Any]:
+    merged: dict[str, Any] = {}
+    origin: dict[str, str] = {}
+    for name, entry in entries.items():
+        for artifact_id, artifact in entry.artifacts.items():
+            if artifact_id in merged:
+                raise ValueError(f"duplicate artifact id {artifact_id!r} in {origin[artifact_id]} and {name}")
+            merged[artifact_id] = artifact
+            origin[artifact_id] = name
+    return merged
+
+
+PATCH_FORMAT = 1
+_HASH_MODULUS = 1 << 256
+
+
+def snapshot_hash(artifacts: Mapping[str, Any]) -> str:
+    """
+    Content hash of an artifact set: the sum (mod 2**256) of per-artifact SHA-256 digests.
+    Being order independent and additive, it can be updated from a patch without rehashing
+    unchanged artifacts. It is a replica consistency check, not an authenticity guarantee.
+    """
+    total = 0
+    for artifact_id, artifact in artifacts.items():
+        total += _entry_digest(artifact_id, artifact)
+    return _format_hash(total)
+
+
+def diff_snapshots(
+    base: Mapping[str, Any],
+    target: Mapping[str, Any],
+    *,
+    base_hash: str | None = None,
+) -> dict[str, Any]:
+    """
+    Compute a JSON-serializable patch turning `base` into `target`: new artifacts in `put`,
+    field-level `set`/`unset` changes in `update`, and dropped ids in `remove`.
+    """
+    base_total = int(base_hash, 16) if base_hash is not None else int(snapshot_hash(base), 16)
+    target_total = base_total
+    put: dict[str, Any] = {}
+    update: dict[str, Any] = {}
+    remove: list[str] = []
+
+    for artifact_id in sorted(base.keys() - target.keys()):
+        remove.append(artifact_id)
+        target_total -= _entry_digest(artifact_id, base[artifact_id])
+    for artifact_id in sorted(target.keys()):
+        new = target[artifact_id]
+        if artifact_id not in base:
+            put[artifact_id] = _plain(new)
+            target_total += _entry_digest(artifact_id, new)
+            continue
+        old = base[artifact_id]
+        if old is new or _canonical(old) == _canonical(new):
+            continue
+        if isinstance(old, Mapping) and isinstance(new, Mapping):
+            update[artifact_id] = {
+                "set": {key: value for key, value in new.items() if key not in old or _canonical(old[key]) != _canonical(value)},
+                "unset": sorted(old.keys() - new.keys()),
+            }
+        else:
+            put[artifact_id] = _plain(new)
+        target_total += _entry_digest(artifact_id, new) - _entry_digest(artifact_id, old)
+
+    return {
+        "format": PATCH_FORMAT,
+        "base_hash": _format_hash(base_total),
+        "target_hash": _format_hash(target_total),
+        "put": put,
+        "update": update,
+        "remove": remove,
+    }
+
+
+def apply_patch(
+    base: Mapping[str, Any],
+    patch: Mapping[str, Any],
+    *,
+    base_hash: str | None = None,
+) -> dict[str, Any]:
+    """
+    Build the target artifact set from `base` and a `diff_snapshots()` patch. Raises ValueError
+    if `base` is not the snapshot the patch was computed against, or if the result does not hash
+    to the patch's target hash. Unchanged artifacts are shared with `base`.
+    """
+    _validate_patch(patch)
+    actual_base_hash = base_hash if base_hash is not None else snapshot_hash(base)
+    if actual_base_hash != patch["base_hash"]:
+        raise ValueError(f"snapshot patch base hash {patch['base_hash']} does not match {actual_base_hash}")
+
+    result = dict(base)
+    total = int(actual_base_hash, 16)
+    for artifact_id in patch["remove"]:
+        if artifact_id not in result:
+            raise ValueError(f"snapshot patch removes unknown artifact {artifact_id!r}")
+        total -= _entry_digest(artifact_id, result.pop(artifact_id))
+    for artifact_id, changes in patch["update"].items():
+        old = result.get(artifact_id)
+        if not isinstance(old, Mapping):
+            raise ValueError(f"snapshot patch updates unknown artifact {artifact_id!r}")
+        new = {key: value for key, value in old.items() if key not in changes["unset"]}
+        new.update(changes["set"])
+        result[artifact_id] = new
+        total += _entry_digest(artifact_id, new) - _entry_digest(artifact_id, old)
+    for artifact_id, artifact in patch["put"].items():
+        if artifact_id in result:
+            total -= _entry_digest(artifact_id, result[artifact_id])
+        result[artifact_id] = artifact
+        total += _entry_digest(artifact_id, artifact)
+
+    if _format_hash(total) != patch["target_hash"]:
+        raise ValueError("snapshot patch result does not match its target hash")
+    return result
+
+
+def _validate_patch(patch: Any) -> None:
+    if not isinstance(patch, Mapping):
+        raise ValueError("snapshot patch must be an object")
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError(f"unsupported snapshot patch format {patch.get('format')!r}")
+    for field in ("base_hash", "target_hash"):
+        value = patch.get(field)
+        if not isinstance(value, str) or len(value) != 64 or value.strip("0123456789abcdef"):
+            raise ValueError(f"snapshot patch {field} must be a 64-digit lowercase hex string")
+    put, update, remove = patch.get("put"), patch.get("update"), patch.get("remove")
+    if not isinstance(put, Mapping) or not all(isinstance(key, str) for key in put):
+        raise ValueError("snapshot patch put must be an object of artifact id -> artifact")
+    if not isinstance(remove, list) or not all(isinstance(key, str) for key in remove):
+        raise ValueError("snapshot patch remove must be a list of artifact ids")
+    if not isinstance(update, Mapping):
+        raise ValueError("snapshot patch update must be an object of artifact id -> changes")
+    for artifact_id, changes in update.items():
+        if (
+            not isinstance(artifact_id, str)
+            or not isinstance(changes, Mapping)
+            or not isinstance(changes.get("set"), Mapping)
+            or not isinstance(changes.get("unset"), list)
+        ):
+            raise ValueError(f"snapshot patch update for {artifact_id!r} must have a set object and an unset list")
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    # Non-dict artifacts such as `CompactArtifact` hash like the dict they were built from.
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _plain(artifact: Any) -> Any:
+    return dict(artifact) if isinstance(artifact, Mapping) and not isinstance(artifact, dict) else artifact
+
+
+def _entry_digest(artifact_id: str, artifact: Any) -> int:
+    digest = hashlib.sha256(f"{artifact_id}\0{_canonical(artifact)}".encode("utf-8")).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _format_hash(total: int) -> str:
+    return f"{total % _HASH_MODULUS:064x}"
@@ -0,0 +1,545 @@
+"""
+Compact binary wire encoding for enforcement results and (drc, context) requests.
+
+Frame layout (little endian):
+    header   magic "GT", format version (u8), kind (u8), flags (u8), string count (u32)
+    lengths  byte length of each table string (u16, or u32 with the long-strings flag)
+    strings  concatenated UTF-8 bytes of the string table
+    body     kind-specific; strings are referenced by index into the table, stored as
+             u8/u16/u32 depending on the table size
+
+Projection-shaped DRCs and contexts use a fixed field layout; any other value falls back
+to a tagged encoding of JSON-like values.
+
+Request frames are about half the size of the equivalent JSON, but encoding and decoding them
+in pure Python costs more CPU than the C `json` module; result frames are both smaller and faster
+than `dataclasses.asdict` + `json`. See benchmarks/bench_wire.py.
+"""
+
+from __future__ import annotations
+
+import functools
+import struct
+from itertools import accumulate
+from typing import Any
+
+from . import errors
+from .types import EnforcementResult
+
+MAGIC = b"GT"
+FORMAT_VERSION = 1
+
+_KIND_RESULT = 1
+_KIND_REQUEST = 2
+_FLAG_LONG_STRINGS = 0x01
+
+_HEADER = struct.Struct("<2sBBBI")
+
+_OUTCOMES = ("EXECUTE", "DENY")
+_OUTCOME_INDEX = {outcome: index for index, outcome in enumerate(_OUTCOMES)}
+_REASON_INDEX = {code: index for index, code in enumerate(errors.REASON_CODES)}
+_REASON_UNKNOWN = 0xFF
+
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_FLOAT = 4
+_TAG_STR = 5
+_TAG_LIST = 6
+_TAG_DICT = 7
+_TAG_BIGINT = 8
+
+_LAYOUT_GENERIC = 0
+_LAYOUT_PROJECTION = 1
+
+_DRC_KEYS = frozenset({"id", "revision", "result", "gtaf_ref", "scope", "valid_from", "valid_until", "refs"})
+_DRC_STRING_FIELDS = ("id", "result", "scope", "valid_from", "valid_until")
+_REF_GROUPS = ("sb", "dr", "rb")
+_REF_GROUP_KEYS = frozenset(_REF_GROUPS)
+_CONTEXT_FIELDS = ("scope", "component", "interface", "action")
+_CONTEXT_INDEX = {field: index for index, field in enumerate(_CONTEXT_FIELDS)}
+_STR_ONLY = frozenset({str})
+
+_I64_MIN = -(2**63)
+_I64_MAX = 2**63 - 1
+
+
+def result_to_bytes(result: EnforcementResult) -> bytes:
+    encoder = _Encoder()
+    outcome = _OUTCOME_INDEX.get(result.outcome)
+    if outcome is None:
+        raise ValueError(f"unsupported outcome {result.outcome!r}")
+    reason = _REASON_INDEX.get(result.reason_code, _REASON_UNKNOWN)
+    if reason != _REASON_UNKNOWN and _is_projection_result(result):
+        encoder.add("BBBq", _LAYOUT_PROJECTION, outcome, reason, result.revision)
+        encoder.string(result.drc_id)
+        encoder.string(result.valid_until)
+        encoder.strings_list(result.refs)
+        return encoder.finish(_KIND_RESULT)
+
+    encoder.add("BBB", _LAYOUT_GENERIC, outcome, reason)
+    if reason == _REASON_UNKNOWN:
+        encoder.string(result.reason_code)
+    encoder.value(result.drc_id)
+    encoder.value(result.revision)
+    encoder.value(result.valid_until)
+    encoder.strings_list(result.refs)
+    encoder.value(result.details)
+    return encoder.finish(_KIND_RESULT)
+
+
+def result_from_bytes(data: bytes | bytearray | memoryview) -> EnforcementResult:
+    decoder = _Decoder(data, _KIND_RESULT)
+    try:
+        layout, outcome, reason = decoder.read("BBB")
+        if layout == _LAYOUT_PROJECTION:
+            revision, drc_id, valid_until = decoder.read("q" + decoder.index_code * 2)
+            result = EnforcementResult(
+                outcome=_OUTCOMES[outcome],
+                drc_id=decoder.strings[drc_id],
+                revision=revision,
+                valid_until=decoder.strings[valid_until],
+                reason_code=errors.REASON_CODES[reason],
+                refs=decoder.strings_list(),
+                details={},
+            )
+        elif layout == _LAYOUT_GENERIC:
+            reason_code = decoder.string() if reason == _REASON_UNKNOWN else errors.REASON_CODES[reason]
+            result = EnforcementResult(
+                outcome=_OUTCOMES[outcome],
+                drc_id=decoder.value(),
+                revision=decoder.value(),
+                valid_until=decoder.value(),
+                reason_code=reason_code,
+                refs=decoder.strings_list(),
+                details=decoder.value(),
+            )
+        else:
+            raise ValueError(f"unknown result layout {layout}")
+    except (struct.error, IndexError, RecursionError) as exc:
+        raise ValueError(f"malformed enforcement result frame: {exc}") from exc
+    decoder.finish()
+    return result
+
+
+def request_to_bytes(drc: dict[str, Any], context: dict[str, Any]) -> bytes:
+    frame = _projection_request_to_bytes(drc, context)
+    if frame is not None:
+        return frame
+    encoder = _Encoder()
+    encoder.drc(drc)
+    encoder.context(context)
+    return encoder.finish(_KIND_REQUEST)
+
+
+def request_from_bytes(data: bytes | bytearray | memoryview) -> tuple[dict[str, Any], dict[str, Any]]:
+    request = _projection_request_from_bytes(data)
+    if request is not None:
+        return request
+    decoder = _Decoder(data, _KIND_REQUEST)
+    try:
+        drc = decoder.drc()
+        context = decoder.context()
+    except (struct.error, IndexError, RecursionError) as exc:
+        raise ValueError(f"malformed enforcement request frame: {exc}") from exc
+    decoder.finish()
+    return drc, context
+
+
+def _projection_request_to_bytes(drc: Any, context: Any) -> bytes | None:
+    """
+    Fast path for the common request: a projection-shaped DRC and context, encoded to the same
+    bytes as `_Encoder` but with the string table and body packed straight from flat lists.
+    Returns None for anything else.
+    """
+    if not (isinstance(drc, dict) and drc.keys() == _DRC_KEYS and isinstance(context, dict)):
+        return None
+    revision, gtaf_ref, refs = drc["revision"], drc["gtaf_ref"], drc["refs"]
+    if type(revision) is not int or not _I64_MIN <= revision <= _I64_MAX:
+        return None
+    if not (isinstance(gtaf_ref, dict) and gtaf_ref.keys() == {"version"}):
+        return None
+    if not (isinstance(refs, dict) and refs.keys() == _REF_GROUP_KEYS):
+        return None
+    sb, dr, rb = refs["sb"], refs["dr"], refs["rb"]
+    if not (type(sb) is list and type(dr) is list and type(rb) is list):
+        return None
+    fields = list(map(_CONTEXT_INDEX.get, context))
+    if None in fields:
+        return None
+    values = [
+        drc["id"], drc["result"], drc["scope"], drc["valid_from"], drc["valid_until"], gtaf_ref["version"],
+        *sb, *dr, *rb, *context.values(),
+    ]  # fmt: skip
+    if not set(map(type, values)) <= _STR_ONLY:
+        return None
+
+    table: dict[str, int] = {}
+    indices = [table.setdefault(value, len(table)) for value in values]
+    strings = list(table)
+    joined = "".join(strings)
+    if joined.isascii():
+        # One encode for the whole table; character lengths are byte lengths.
+        encoded = [joined.encode("ascii")]
+        lengths = list(map(len, strings))
+    else:
+        encoded = [text.encode("utf-8") for text in strings]
+        lengths = list(map(len, encoded))
+    long_strings = max(lengths) > 0xFFFF
+    index_code = _index_code(len(strings))
+    n_sb, n_dr, n_rb, n_context = len(sb), len(dr), len(rb), len(context)
+    body = _struct(
+        f"Bq{index_code * 6}I{index_code * n_sb}I{index_code * n_dr}I{index_code * n_rb}"
+        f"BB{('B' + index_code) * n_context}"
+    )
+    refs_end = 6 + n_sb + n_dr + n_rb
+    context_args = [None] * (2 * n_context)
+    context_args[::2] = fields
+    context_args[1::2] = indices[refs_end:]
+    return b"".join(
+        (
+            _HEADER.pack(MAGIC, FORMAT_VERSION, _KIND_REQUEST, _FLAG_LONG_STRINGS if long_strings else 0, len(strings)),
+            _struct(f"{len(strings)}{'I' if long_strings else 'H'}").pack(*lengths),
+            *encoded,
+            body.pack(
+                _LAYOUT_PROJECTION, revision, *indices[:6],
+                n_sb, *indices[6 : 6 + n_sb],
+                n_dr, *indices[6 + n_sb : 6 + n_sb + n_dr],
+                n_rb, *indices[6 + n_sb + n_dr : refs_end],
+                _LAYOUT_PROJECTION, n_context, *context_args,
+            ),  # fmt: skip
+        )
+    )
+
+
+def _projection_request_from_bytes(
+    data: bytes | bytearray | memoryview,
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """
+    Fast path for a well-formed projection-layout request with an ASCII string table, unpacked
+    with a handful of cached structs. Returns None for anything else, including malformed
+    frames, so `_Decoder` produces the result or the error.
+    """
+    try:
+        view = memoryview(data).cast("B")
+        magic, version, kind, flags, count = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or kind != _KIND_REQUEST or flags:
+            return None
+        lengths_layout = _struct(f"{count}H")
+        start = _HEADER.size + lengths_layout.size
+        lengths = lengths_layout.unpack_from(view, _HEADER.size)
+        offset = start + sum(lengths)
+        text = str(view[start:offset], "utf-8")
+        if len(text) != offset - start or not text.isascii():
+            return None
+        bounds = list(accumulate(lengths, initial=0))
+        strings = list(map(text.__getitem__, map(slice, bounds, bounds[1:])))
+
+        index_code = _index_code(count)
+        layout = _struct(f"Bq{index_code * 6}I")
+        drc_layout, revision, *drc_fields, n_sb = layout.unpack_from(view, offset)
+        offset += layout.size
+        layout = _struct(f"{index_code * n_sb}I")
+        *sb, n_dr = layout.unpack_from(view, offset)
+        offset += layout.size
+        layout = _struct(f"{index_code * n_dr}I")
+        *dr, n_rb = layout.unpack_from(view, offset)
+        offset += layout.size
+        layout = _struct(f"{index_code * n_rb}BB")
+        *rb, context_layout, n_context = layout.unpack_from(view, offset)
+        offset += layout.size
+        layout = _struct(("B" + index_code) * n_context)
+        context_items = layout.unpack_from(view, offset)
+        if (
+            drc_layout != _LAYOUT_PROJECTION
+            or context_layout != _LAYOUT_PROJECTION
+            or offset + layout.size != len(view)
+        ):
+            return None
+        drc_id, result, scope, valid_from, valid_until, gtaf_version = map(strings.__getitem__, drc_fields)
+        drc = {
+            "id": drc_id,
+            "revision": revision,
+            "result": result,
+            "gtaf_ref": {"version": gtaf_version},
+            "scope": scope,
+            "valid_from": valid_from,
+            "valid_until": valid_until,
+            "refs": {
+                "sb": list(map(strings.__getitem__, sb)),
+                "dr": list(map(strings.__getitem__, dr)),
+                "rb": list(map(strings.__getitem__, rb)),
+            },
+        }
+        context = dict(
+            zip(map(_CONTEXT_FIELDS.__getitem__, context_items[::2]), map(strings.__getitem__, context_items[1::2]))
+        )
+    except (struct.error, IndexError, TypeError, UnicodeDecodeError):
+        return None
+    return drc, context
+
+
+def _is_projection_drc(drc: Any) -> bool:
+    if not isinstance(drc, dict) or drc.keys() != _DRC_KEYS:
+        return False
+    revision = drc["revision"]
+    if type(revision) is not int or not _I64_MIN <= revision <= _I64_MAX:
+        return False
+    if not all(type(drc[field]) is str for field in _DRC_STRING_FIELDS):
+        return False
+    gtaf_ref = drc["gtaf_ref"]
+    if not isinstance(gtaf_ref, dict) or gtaf_ref.keys() != {"version"} or type(gtaf_ref["version"]) is not str:
+        return False
+    refs = drc["refs"]
+    if not isinstance(refs, dict) or refs.keys() != set(_REF_GROUPS):
+        return False
+    return all(type(refs[group]) is list and all(type(ref) is str for ref in refs[group]) for group in _REF_GROUPS)
+
+
+def _is_projection_result(result: EnforcementResult) -> bool:
+    return (
+        type(result.drc_id) is str
+        and type(result.revision) is int
+        and _I64_MIN <= result.revision <= _I64_MAX
+        and type(result.valid_until) is str
+        and result.details == {}
+    )
+
+
+def _is_projection_context(context: Any) -> bool:
+    if not isinstance(context, dict) or not context.keys() <= set(_CONTEXT_FIELDS):
+        return False
+    return all(type(value) is str for value in context.values())
+
+
+class _Encoder:
+    """Collects the body as struct format codes plus arguments and packs it in one call."""
+
+    __slots__ = ("strings", "codes", "args")
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.codes: list[str] = []
+        self.args: list[Any] = []
+
+    def add(self, codes: str, *args: Any) -> None:
+        self.codes.append(codes)
+        self.args.extend(args)
+
+    def string(self, value: str) -> None:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        self.codes.append("S")
+        self.args.append(index)
+
+    def strings_list(self, values: list[str]) -> None:
+        self.add("I", len(values))
+        for value in values:
+            self.string(value)
+
+    def drc(self, drc: Any) -> None:
+        if not _is_projection_drc(drc):
+            self.add("B", _LAYOUT_GENERIC)
+            self.value(drc)
+            return
+        self.add("Bq", _LAYOUT_PROJECTION, drc["revision"])
+        for field in _DRC_STRING_FIELDS:
+            self.string(drc[field])
+        self.string(drc["gtaf_ref"]["version"])
+        for group in _REF_GROUPS:
+            self.strings_list(drc["refs"][group])
+
+    def context(self, context: Any) -> None:
+        if not _is_projection_context(context):
+            self.add("B", _LAYOUT_GENERIC)
+            self.value(context)
+            return
+        # Field ids are written in the context's own key order.
+        self.add("BB", _LAYOUT_PROJECTION, len(context))
+        for key, value in context.items():
+            self.add("B", _CONTEXT_FIELDS.index(key))
+            self.string(value)
+
+    def value(self, value: Any) -> None:
+        if value is None:
+            self.add("B", _TAG_NONE)
+        elif value is True:
+            self.add("B", _TAG_TRUE)
+        elif value is False:
+            self.add("B", _TAG_FALSE)
+        elif isinstance(value, str):
+            self.add("B", _TAG_STR)
+            self.string(value)
+        elif isinstance(value, int):
+            if _I64_MIN <= value <= _I64_MAX:
+                self.add("Bq", _TAG_INT, value)
+            else:
+                self.add("B", _TAG_BIGINT)
+                self.string(str(value))
+        elif isinstance(value, float):
+            self.add("Bd", _TAG_FLOAT, value)
+        elif isinstance(value, dict):
+            self.add("BI", _TAG_DICT, len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise ValueError(f"unsupported non-string key {key!r}")
+                self.string(key)
+                self.value(item)
+        elif isinstance(value, (list, tuple)):
+            self.add("BI", _TAG_LIST, len(value))
+            for item in value:
+                self.value(item)
+        else:
+            raise ValueError(f"unsupported value type {type(value).__name__}")
+
+    def finish(self, kind: int) -> bytes:
+        encoded = [text.encode("utf-8") for text in self.strings]
+        long_strings = any(len(item) > 0xFFFF for item in encoded)
+        length_code = "I" if long_strings else "H"
+        body_format = "<" + "".join(self.codes).replace("S", _index_code(len(encoded)))
+        return b"".join(
+            (
+                _HEADER.pack(MAGIC, FORMAT_VERSION, kind, _FLAG_LONG_STRINGS if long_strings else 0, len(encoded)),
+                struct.pack(f"<{len(encoded)}{length_code}", *map(len, encoded)),
+                *encoded,
+                struct.pack(body_format, *self.args),
+            )
+        )
+
+
+class _Decoder:
+    """Decodes directly from a memoryview over the input; only strings are materialized."""
+
+    __slots__ = ("view", "offset", "strings", "index_code")
+
+    def __init__(self, data: bytes | bytearray | memoryview, kind: int) -> None:
+        self.view = memoryview(data).cast("B")
+        try:
+            magic, version, frame_kind, flags, count = _HEADER.unpack_from(self.view, 0)
+        except struct.error as exc:
+            raise ValueError(f"truncated frame header: {exc}") from exc
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a gtaf-runtime wire frame or unsupported format version")
+        if frame_kind != kind:
+            raise ValueError(f"unexpected frame kind {frame_kind}, expected {kind}")
+        self.offset = _HEADER.size
+        self.index_code = _index_code(count)
+        length_code = "I" if flags & _FLAG_LONG_STRINGS else "H"
+        try:
+            lengths = self.read(f"{count}{length_code}")
+            start = self.offset
+            end = start + sum(lengths)
+            if end > len(self.view):
+                raise ValueError("string table exceeds frame length")
+            text = str(self.view[start:end], "utf-8")
+            if text.isascii():
+                # Byte offsets are character offsets, so the table is sliced out of one decode.
+                bounds = list(accumulate(lengths, initial=0))
+                self.strings: list[str] = list(map(text.__getitem__, map(slice, bounds, bounds[1:])))
+            else:
+                self.strings = []
+                for length in lengths:
+                    self.strings.append(str(self.view[start : start + length], "utf-8"))
+                    start += length
+            self.offset = end
+        except (struct.error, UnicodeDecodeError) as exc:
+            raise ValueError(f"malformed string table: {exc}") from exc
+
+    def read(self, codes: str) -> tuple[Any, ...]:
+        layout = _struct(codes)
+        values = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size
+        return values
+
+    def string(self) -> str:
+        (index,) = self.read(self.index_code)
+        return self.strings[index]
+
+    def strings_list(self) -> list[str]:
+        (count,) = self.read("I")
+        strings = self.strings
+        return [strings[index] for index in self.read(f"{count}{self.index_code}")]
+
+    def drc(self) -> Any:
+        (layout,) = self.read("B")
+        if layout == _LAYOUT_GENERIC:
+            return self.value()
+        if layout != _LAYOUT_PROJECTION:
+            raise ValueError(f"unknown DRC layout {layout}")
+        revision, drc_id, result, scope, valid_from, valid_until, version = self.read("q" + self.index_code * 6)
+        strings = self.strings
+        drc_id, result, scope, valid_from, valid_until, version = (
+            strings[drc_id],
+            strings[result],
+            strings[scope],
+            strings[valid_from],
+            strings[valid_until],
+            strings[version],
+        )
+        refs = {group: self.strings_list() for group in _REF_GROUPS}
+        return {
+            "id": drc_id,
+            "revision": revision,
+            "result": result,
+            "gtaf_ref": {"version": version},
+            "scope": scope,
+            "valid_from": valid_from,
+            "valid_until": valid_until,
+            "refs": refs,
+        }
+
+    def context(self) -> Any:
+        (layout,) = self.read("B")
+        if layout == _LAYOUT_GENERIC:
+            return self.value()
+        if layout != _LAYOUT_PROJECTION:
+            raise ValueError(f"unknown context layout {layout}")
+        (count,) = self.read("B")
+        context: dict[str, str] = {}
+        for _ in range(count):
+            (field,) = self.read("B")
+            context[_CONTEXT_FIELDS[field]] = self.string()
+        return context
+
+    def value(self) -> Any:
+        (tag,) = self.read("B")
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_STR:
+            return self.string()
+        if tag == _TAG_INT:
+            return self.read("q")[0]
+        if tag == _TAG_FLOAT:
+            return self.read("d")[0]
+        if tag == _TAG_DICT:
+            (count,) = self.read("I")
+            return {self.string(): self.value() for _ in range(count)}
+        if tag == _TAG_LIST:
+            (count,) = self.read("I")
+            return [self.value() for _ in range(count)]
+        if tag == _TAG_BIGINT:
+            return int(self.string())
+        raise ValueError(f"unknown value tag {tag}")
+
+    def finish(self) -> None:
+        if self.offset != len(self.view):
+            raise ValueError("trailing bytes after frame body")
+
+
+@functools.lru_cache(maxsize=256)
+def _struct(codes: str) -> struct.Struct:
+    return struct.Struct("<" + codes)
+
+
+def _index_code(count: int) -> str:
+    if count <= 0x100:
+        return "B"
+    if count <= 0x10000:
+        return "H"
+    return "I"
@@ -1,4 +1,20 @@
+import json
+from datetime import datetime
 from pathlib import Path
 
 
 CONTRACT_FIXTURE_ROOT = Path(__file__).parent.parent / "contract_fixtures" / "v0.1"
+CASE_DIRS = sorted(path.name for path in CONTRACT_FIXTURE_ROOT.iterdir() if path.is_dir())
+
+
+def load_case(case_name: str) -> tuple[dict, dict, dict, datetime]:
+    """(drc, artifacts, context, now) of one contract fixture case."""
+    case_dir = CONTRACT_FIXTURE_ROOT / case_name
+
+    def load(name: str) -> dict:
+        with (case_dir / name).open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    expected = load("expected.json")
+    now = datetime.fromisoformat(expected["now"].replace("Z", "+00:00"))
+    return load("drc.json"), load("artifacts.json"), load("context.json"), now
@@ -0,0 +1,85 @@
+import asyncio
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gtaf_runtime import MicroBatcher, enforce, evaluate_batch
+from gtaf_runtime import batching as batching_module
+
+try:
+    from tests._fixture_paths import CASE_DIRS, load_case
+except ModuleNotFoundError:
+    from _fixture_paths import CASE_DIRS, load_case
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_package_import_does_not_load_asyncio(self) -> None:
+        code = (
+            "import sys, gtaf_runtime; assert 'asyncio' not in sys.modules; "
+            "from gtaf_runtime import MicroBatcher; assert 'asyncio' in sys.modules"
+        )
+        root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+class EvaluateBatchTests(unittest.TestCase):
+    def test_batch_matches_enforce_per_request(self) -> None:
+        cases = [load_case(case_name) for case_name in CASE_DIRS]
+        drc, artifacts, context, now = cases[CASE_DIRS.index("happy_execute")]
+        shared_contexts = [context, dict(context, action="unknown"), dict(context, interface="other"), {}]
+
+        requests = [(case_drc, case_context) for case_drc, _, case_context, _ in cases]
+        requests += [(drc, shared_context) for shared_context in shared_contexts]
+
+        results = evaluate_batch(requests, artifacts, now=now)
+
+        self.assertEqual(results, [enforce(d, c, artifacts, now=now) for d, c in requests])
+        self.assertEqual(
+            [result.reason_code for result in results[-4:]], ["OK", "DR_MISMATCH", "OUTSIDE_SB", "SCOPE_LEAK"]
+        )
+
+    def test_context_independent_work_runs_once_per_drc(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        with mock.patch.object(batching_module, "_compile_drc", wraps=batching_module._compile_drc) as compile_drc:
+            evaluate_batch([(drc, context)] * 50, artifacts, now=now)
+
+        self.assertEqual(compile_drc.call_count, 1)
+
+
+class MicroBatcherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_requests_are_flushed_as_one_batch(self) -> None:
+        drc, artifacts, context, _ = load_case("happy_execute")
+        batcher = MicroBatcher(artifacts)
+
+        with mock.patch.object(batching_module, "evaluate_batch", wraps=batching_module.evaluate_batch) as batch:
+            results = await asyncio.gather(*(batcher.enforce(drc, context) for _ in range(20)))
+
+        self.assertEqual(batch.call_count, 1)
+        self.assertEqual(len(batch.call_args.args[0]), 20)
+        self.assertEqual({result.reason_code for result in results}, {"OK"})
+
+    async def test_size_bound_flushes_early(self) -> None:
+        drc, artifacts, context, _ = load_case("happy_execute")
+        batcher = MicroBatcher(artifacts, max_batch_size=8)
+
+        with mock.patch.object(batching_module, "evaluate_batch", wraps=batching_module.evaluate_batch) as batch:
+            await asyncio.gather(*(batcher.enforce(drc, context) for _ in range(20)))
+
+        self.assertEqual([len(call.args[0]) for call in batch.call_args_list], [8, 8, 4])
+
+    async def test_artifact_provider_is_read_per_flush(self) -> None:
+        drc, artifacts, context, _ = load_case("happy_execute")
+        current = {"artifacts": artifacts}
+        batcher = MicroBatcher(lambda: current["artifacts"])
+
+        first = await batcher.enforce(drc, context)
+        current["artifacts"] = {}
+        second = await batcher.enforce(drc, context)
+
+        self.assertEqual((first.reason_code, second.reason_code), ("OK", "MISSING_REFERENCE"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import gc
+import importlib
+import unittest
+import weakref
+from unittest import mock
+
+from gtaf_runtime import CompiledDRCCache, ProjectionPipeline, enforce, evaluate_batch, register_projection_pipeline
+
+try:
+    from tests._fixture_paths import CASE_DIRS, load_case
+except ModuleNotFoundError:
+    from _fixture_paths import CASE_DIRS, load_case
+
+# `gtaf_runtime.enforce` resolves to the function alias, so import the module explicitly.
+enforce_module = importlib.import_module("gtaf_runtime.enforce")
+
+
+def _drc_with_refs(drc_id: str, rb_count: int) -> dict:
+    drc, _, _, _ = load_case("happy_execute")
+    drc["id"] = drc_id
+    drc["refs"]["rb"] = [f"RB-{drc_id}-{index:05d}" for index in range(rb_count)]
+    return drc
+
+
+class CompiledDRCCacheTests(unittest.TestCase):
+    def test_fixture_matrix_matches_enforce_on_miss_and_hit(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        for case_name in CASE_DIRS:
+            with self.subTest(case=case_name):
+                drc, artifacts, context, now = load_case(case_name)
+                expected = enforce(drc, context, artifacts, now=now)
+
+                self.assertEqual(cache.evaluate(drc, context, artifacts, now=now), expected)
+                self.assertEqual(cache.evaluate(drc, context, artifacts, now=now), expected)
+
+    def test_hit_requires_same_artifacts_and_equal_drc(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        drc, artifacts, context, now = load_case("happy_execute")
+
+        cache.evaluate(drc, context, artifacts, now=now)
+        cache.evaluate(dict(drc), context, artifacts, now=now)
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (1, 1))
+
+        toggled = dict(artifacts, **{"RB-FX-001": dict(artifacts["RB-FX-001"], active=False)})
+        self.assertEqual(cache.evaluate(drc, context, toggled, now=now).reason_code, "RB_REQUIRED")
+
+        drc["result"] = "NOT_PERMITTED"
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "DRC_NOT_PERMITTED")
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 3, 1))
+        self.assertAlmostEqual(stats.hit_ratio, 0.25)
+
+    def test_in_place_artifact_changes_invalidate_entry(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        drc, artifacts, context, now = load_case("happy_execute")
+        rb_id = drc["refs"]["rb"][0]
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "OK")
+
+        artifacts[rb_id] = dict(artifacts[rb_id], active=False)
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "RB_REQUIRED")
+
+        artifacts[rb_id]["active"] = True
+        artifacts[rb_id]["valid_until"] = "2026-01-02T00:00:00Z"
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now), enforce(drc, context, artifacts, now=now))
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "EXPIRED")
+
+        missing = artifacts.pop(rb_id)
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "MISSING_REFERENCE")
+        artifacts[rb_id] = dict(missing, valid_until="2026-12-31T00:00:00Z")
+        self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "OK")
+
+    def test_entries_do_not_keep_artifact_mapping_alive(self) -> None:
+        class Artifacts(dict):
+            pass
+
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        drc, raw, context, now = load_case("happy_execute")
+        artifacts = Artifacts(raw)
+        reference = weakref.ref(artifacts)
+        cache.evaluate(drc, context, artifacts, now=now)
+
+        del artifacts
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(cache.stats().entries, 1)
+
+    def test_hits_do_not_grow_eviction_heap(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        drc, artifacts, context, now = load_case("happy_execute")
+
+        for _ in range(1_000):
+            cache.evaluate(drc, context, artifacts, now=now)
+
+        self.assertEqual(cache.stats().hits, 999)
+        self.assertLessEqual(len(cache._heap), 4 * cache.stats().entries + 64)
+
+    def test_malformed_artifact_keeps_first_failure_order(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        drc, artifacts, context, now = load_case("deny_expired_valid_until")
+        artifacts[drc["refs"]["rb"][0]] = ["not", "an", "object"]
+
+        result = cache.evaluate(drc, context, artifacts, now=now)
+
+        self.assertEqual(result, enforce(drc, context, artifacts, now=now))
+        self.assertEqual(cache.stats().entries, 0)
+
+    def test_byte_budget_is_respected(self) -> None:
+        _, artifacts, context, now = load_case("happy_execute")
+        cache = CompiledDRCCache(max_bytes=20_000)
+
+        for index in range(200):
+            cache.evaluate(_drc_with_refs(f"DRC-{index:03d}", 5), context, artifacts, now=now)
+
+        stats = cache.stats()
+        self.assertLessEqual(stats.bytes_used, stats.max_bytes)
+        self.assertGreater(stats.evictions, 0)
+        self.assertEqual(stats.entries + stats.evictions, 200)
+
+    def test_large_rarely_used_drc_is_evicted_before_small_hot_drc(self) -> None:
+        _, artifacts, context, now = load_case("happy_execute")
+        small = _drc_with_refs("DRC-SMALL", 1)
+        large = _drc_with_refs("DRC-LARGE", 3000)
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        cache.evaluate(large, context, artifacts, now=now)
+        large_bytes = cache.stats().bytes_used
+        cache = CompiledDRCCache(max_bytes=large_bytes + 6_000)
+
+        cache.evaluate(small, context, artifacts, now=now)
+        cache.evaluate(large, context, artifacts, now=now)
+        # Large entry is both more recently and as frequently used; size-aware eviction still drops it.
+        cache.evaluate(small, context, artifacts, now=now)
+        cache.evaluate(large, context, artifacts, now=now)
+        for index in range(3):
+            cache.evaluate(_drc_with_refs(f"DRC-{index}", 1), context, artifacts, now=now)
+        hits_before = cache.stats().hits
+
+        cache.evaluate(small, context, artifacts, now=now)
+        self.assertEqual(cache.stats().hits, hits_before + 1)
+        cache.evaluate(large, context, artifacts, now=now)
+        self.assertEqual(cache.stats().hits, hits_before + 1)
+
+    def test_entries_are_charged_for_the_artifacts_they_hold(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        cache.evaluate(drc, context, artifacts, now=now)
+        small = cache.stats().bytes_used
+
+        # A replaced snapshot whose artifacts only a stale entry still references.
+        rb_id = drc["refs"]["rb"][0]
+        heavy = dict(artifacts, **{rb_id: dict(artifacts[rb_id], note="x" * 200_000)})
+        cache.evaluate(drc, context, heavy, now=now)
+        self.assertGreater(cache.stats().bytes_used, small + 200_000)
+
+        cache = CompiledDRCCache(max_bytes=100_000)
+        cache.evaluate(drc, context, heavy, now=now)
+        self.assertEqual(cache.stats().entries, 0)
+
+    def test_registered_pipeline_gets_public_check_signature(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        drc["gtaf_ref"]["version"] = "0.2"
+        calls = []
+
+        def check(*args: object) -> None:
+            calls.append(args)
+
+        with mock.patch.object(enforce_module, "_PIPELINES", enforce_module._PIPELINES):
+            register_projection_pipeline(ProjectionPipeline(version="0.2", check=check))
+            cache = CompiledDRCCache(max_bytes=1 << 20)
+            for _ in range(2):
+                self.assertEqual(cache.evaluate(drc, context, artifacts, now=now).reason_code, "OK")
+            evaluate_batch([(drc, context)] * 2, artifacts, now=now)
+
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual([len(args) for args in calls], [4] * 4)
+        self.assertTrue(all(args[2] is artifacts for args in calls))
+
+    def test_entry_larger_than_budget_is_not_cached(self) -> None:
+        cache = CompiledDRCCache(max_bytes=64)
+        drc, artifacts, context, now = load_case("happy_execute")
+
+        result = cache.evaluate(drc, context, artifacts, now=now)
+
+        self.assertEqual(result.outcome, "EXECUTE")
+        self.assertEqual(cache.stats().entries, 0)
+        self.assertEqual(cache.stats().bytes_used, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from gtaf_runtime.cli import main
+
+try:
+    from tests._fixture_paths import load_case
+except ModuleNotFoundError:
+    from _fixture_paths import load_case
+
+NOW = "2026-02-08T12:00:00Z"
+
+
+class ValidateCommandTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.artifacts_path = self.root / "artifacts.json"
+        self.artifacts_path.write_text(json.dumps(load_case("happy_execute")[1]), encoding="utf-8")
+
+        drcs = self.root / "drcs"
+        (drcs / "nested").mkdir(parents=True)
+        good = load_case("happy_execute")[0]
+        (drcs / "good.json").write_text(json.dumps(good), encoding="utf-8")
+        (drcs / "nested" / "invalid.json").write_text(
+            json.dumps(load_case("deny_invalid_drc_structure")[0]), encoding="utf-8"
+        )
+        (drcs / "broken.json").write_text("{", encoding="utf-8")
+        stream = [
+            good,
+            load_case("deny_expired_valid_until")[0],
+            dict(good, refs=dict(good["refs"], rb=["RB-UNKNOWN"])),
+            dict(good, gtaf_ref={"version": "0.2"}),
+        ]
+        (drcs / "stream.jsonl").write_text("\n".join(json.dumps(item) for item in stream) + "\n\n", encoding="utf-8")
+        self.drcs = drcs
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _run(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["validate", *argv])
+        return code, out.getvalue()
+
+    def test_reports_failures_grouped_by_cause(self) -> None:
+        for jobs in ("1", "2"):
+            with self.subTest(jobs=jobs):
+                code, output = self._run(
+                    str(self.drcs), "--artifacts", str(self.artifacts_path), "--now", NOW, "--jobs", jobs
+                )
+
+                self.assertEqual(code, 1)
+                self.assertIn("checked 7 DRCs: 2 ok, 5 failed", output)
+                for cause in ("PARSE_ERROR", "INVALID_DRC_SCHEMA", "EXPIRED", "UNSUPPORTED_GTAF_VERSION"):
+                    self.assertIn(f"  {cause}: 1", output)
+                self.assertIn(f"FAIL {self.drcs / 'stream.jsonl'}:3 MISSING_REFERENCE rb:RB-UNKNOWN", output)
+
+    def test_clean_input_exits_zero(self) -> None:
+        code, output = self._run(str(self.drcs / "good.json"), "--now", NOW, "--jobs", "1", "--summary-only")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output, "checked 1 DRCs: 1 ok, 0 failed\n")
+
+    def test_artifact_and_drc_windows_match_enforce(self) -> None:
+        artifacts = load_case("happy_execute")[1]
+        later_window = {"valid_from": "2027-01-01T00:00:00Z", "valid_until": "2027-12-31T00:00:00Z"}
+        artifacts.update({f"{ref_id}-LATER": dict(artifacts[ref_id], **later_window) for ref_id in list(artifacts)})
+        del artifacts["SB-FX-001"]["valid_until"]
+        artifacts["DR-FX-001"]["valid_from"] = "2026-01-01T00:00:00"
+        artifacts["RB-FX-001"]["valid_until"] = "soon"
+        self.artifacts_path.write_text(json.dumps(artifacts), encoding="utf-8")
+        good = load_case("happy_execute")[0]
+        naive = dict(good, valid_from="2026-01-01T00:00:00", gtaf_ref={"version": "0.2"})
+        # Published ahead of its start: not yet valid, but not expired either.
+        later = dict(good, **later_window)
+        later["refs"] = {kind: [f"{ref_id}-LATER" for ref_id in ids] for kind, ids in good["refs"].items()}
+        drcs = self.root / "windows.jsonl"
+        drcs.write_text("".join(json.dumps(drc) + "\n" for drc in (good, naive, later)), encoding="utf-8")
+
+        code, output = self._run(str(drcs), "--artifacts", str(self.artifacts_path), "--now", NOW, "--jobs", "1")
+
+        self.assertEqual(code, 1)
+        self.assertIn(f"FAIL {drcs}:1 EXPIRED artifacts SB-FX-001 RB-FX-001", output)
+        self.assertIn(f"FAIL {drcs}:1 INTERNAL_ERROR artifacts DR-FX-001", output)
+        self.assertIn(f"FAIL {drcs}:2 UNSUPPORTED_GTAF_VERSION gtaf_ref.version 0.2", output)
+        self.assertIn(f"FAIL {drcs}:2 INTERNAL_ERROR drc window 2026-01-01T00:00:00..", output)
+        self.assertNotIn(f"{drcs}:3", output)
+        self.assertIn("checked 3 DRCs: 1 ok, 2 failed", output)
+
+    def test_deeply_nested_json_is_a_parse_error(self) -> None:
+        nested = self.root / "nested.json"
+        nested.write_text("[" * 100_000, encoding="utf-8")
+
+        code, output = self._run(str(nested), str(self.drcs / "good.json"), "--now", NOW, "--jobs", "1")
+
+        self.assertEqual(code, 1)
+        self.assertIn(f"FAIL {nested} PARSE_ERROR", output)
+        self.assertIn("checked 2 DRCs: 1 ok, 1 failed", output)
+
+    def test_non_object_artifact_is_reported(self) -> None:
+        artifacts = load_case("happy_execute")[1]
+        artifacts["RB-FX-001"] = ["not", "an", "object"]
+        self.artifacts_path.write_text(json.dumps(artifacts), encoding="utf-8")
+
+        code, output = self._run(
+            str(self.drcs / "good.json"), "--artifacts", str(self.artifacts_path), "--now", NOW, "--jobs", "1"
+        )
+
+        self.assertEqual(code, 1)
+        self.assertIn("INTERNAL_ERROR artifacts RB-FX-001", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
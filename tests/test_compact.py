@@ -0,0 +1,114 @@
+import pickle
+import unittest
+
+from gtaf_runtime import ArtifactInterner, CompactArtifact, CompiledDRCCache, MemberList, compact_artifacts, enforce
+
+try:
+    from tests._fixture_paths import CASE_DIRS, load_case
+except ModuleNotFoundError:
+    from _fixture_paths import CASE_DIRS, load_case
+
+
+class CompactArtifactTests(unittest.TestCase):
+    def test_fixture_matrix_matches_plain_dicts(self) -> None:
+        cache = CompiledDRCCache(max_bytes=1 << 20)
+        for case_name in CASE_DIRS:
+            with self.subTest(case=case_name):
+                drc, artifacts, context, now = load_case(case_name)
+                compact = compact_artifacts(artifacts)
+                expected = enforce(drc, context, artifacts, now=now)
+
+                self.assertEqual(enforce(drc, context, compact, now=now), expected)
+                self.assertEqual(cache.evaluate(drc, context, compact, now=now), expected)
+
+    def test_get_matches_dict_get(self) -> None:
+        raw = {"scope": "ops.prod", "active": None, "decisions": ["a", "b", "a"], "note": "x"}
+        item = compact_artifacts({"DR-1": raw})["DR-1"]
+
+        self.assertIsInstance(item, CompactArtifact)
+        self.assertEqual(item.get("scope"), "ops.prod")
+        self.assertIsNone(item.get("active", "absent"))
+        self.assertEqual(item.get("linked_scopes", []), [])
+        self.assertEqual(item.get("decisions"), ["a", "b", "a"])
+        self.assertIsInstance(item.get("decisions"), MemberList)
+        self.assertEqual(item.get("note"), "x")
+        self.assertEqual(item.get("get", "absent"), "absent")
+        self.assertEqual(set(item), set(raw))
+        self.assertEqual(item.to_dict(), raw)
+        self.assertIs(type(item.to_dict()["decisions"]), list)
+        with self.assertRaises(KeyError):
+            item["linked_scopes"]
+        with self.assertRaises(AttributeError):
+            item.scope = "other"
+
+    def test_constructor_matches_interned_artifact(self) -> None:
+        empty = CompactArtifact()
+        self.assertEqual((len(empty), dict(empty), empty.get("scope", "absent")), (0, {}, "absent"))
+
+        raw = {"scope": "ops.prod", "linked_scopes": ["ops.dev"], "note": "x"}
+        item = CompactArtifact(raw)
+        self.assertEqual(item, compact_artifacts({"SB-1": raw})["SB-1"])
+        self.assertEqual(list(item), ["scope", "linked_scopes", "note"])
+        self.assertIsInstance(item["linked_scopes"], MemberList)
+        self.assertEqual(item.to_dict(), raw)
+
+    def test_strings_and_sets_are_shared(self) -> None:
+        raw = {
+            f"SB-{index}": {
+                "scope": "ops." + "prod",
+                "included_components": ["agent", "worker"],
+                "allowed_interfaces": ["api"],
+                "valid_from": "2026-01-01T00:00:" + "00Z",
+            }
+            for index in range(3)
+        }
+        interner = ArtifactInterner()
+        first = interner.compact_all(raw)
+        second = interner.compact_all({"SB-9": dict(raw["SB-0"], included_components=["agent", "worker"])})
+
+        items = [*first.values(), *second.values()]
+        for field in ("scope", "included_components", "allowed_interfaces", "valid_from"):
+            self.assertTrue(all(item.get(field) is items[0].get(field) for item in items), field)
+
+    def test_member_lists_are_read_only(self) -> None:
+        members = compact_artifacts({"SB-1": {"allowed_interfaces": ["api", "cli"]}})["SB-1"].get("allowed_interfaces")
+
+        for mutate in (
+            lambda: members.append("ssh"),
+            lambda: members.extend(["ssh"]),
+            lambda: members.sort(),
+            lambda: members.__setitem__(0, "ssh"),
+            lambda: members.__delitem__(0),
+            lambda: members.__iadd__(["ssh"]),
+        ):
+            with self.assertRaises(TypeError):
+                mutate()
+        self.assertEqual(members, ["api", "cli"])
+        self.assertEqual(pickle.loads(pickle.dumps(members)), members)
+
+    def test_raw_frozensets_are_still_rejected(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        artifacts["DR-FX-001"]["decisions"] = frozenset(artifacts["DR-FX-001"]["decisions"])
+
+        self.assertEqual(enforce(drc, context, artifacts, now=now).reason_code, "DR_MISMATCH")
+
+    def test_non_string_lists_keep_list_semantics(self) -> None:
+        _, artifacts, _, _ = load_case("happy_execute")
+        artifacts["DR-FX-001"]["decisions"] = ["restart_worker", 1]
+        artifacts["RB-FX-001"] = "not-an-artifact"
+
+        compact = compact_artifacts(artifacts)
+
+        self.assertEqual(compact["DR-FX-001"].get("decisions"), ["restart_worker", 1])
+        self.assertEqual(compact["RB-FX-001"], "not-an-artifact")
+
+    def test_pickle_round_trip_keeps_sharing(self) -> None:
+        _, artifacts, _, _ = load_case("happy_execute")
+        restored = pickle.loads(pickle.dumps(compact_artifacts(artifacts)))
+
+        self.assertEqual(restored["SB-FX-001"], compact_artifacts(artifacts)["SB-FX-001"])
+        self.assertIs(restored["SB-FX-001"].get("scope"), restored["DR-FX-001"].get("scope"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import unittest
+
+from gtaf_runtime.middleware import SCOPE_KEY, EnforcementMiddleware, WSGIEnforcementMiddleware
+
+try:
+    from tests._fixture_paths import load_case
+except ModuleNotFoundError:
+    from _fixture_paths import load_case
+
+DRC, ARTIFACTS, CONTEXT, _ = load_case("happy_execute")
+
+
+def _drc_for(context: dict) -> dict | None:
+    return DRC if context.get("scope") == DRC["scope"] else None
+
+
+def _asgi_scope(context: dict) -> dict:
+    headers = [(f"x-gtaf-{key}".encode("latin-1"), value.encode("latin-1")) for key, value in context.items()]
+    return {"type": "http", "method": "POST", "path": "/", "headers": headers}
+
+
+class ASGIEnforcementMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.seen: list[dict] = []
+
+        async def app(scope: dict, receive, send) -> None:
+            self.seen.append(scope)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        self.middleware = EnforcementMiddleware(app, artifacts=ARTIFACTS, drc_for=_drc_for)
+
+    async def _request(self, scope: dict) -> list[dict]:
+        messages: list[dict] = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b""}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        await self.middleware(scope, receive, send)
+        return messages
+
+    async def test_allowed_and_denied_requests_in_one_tick(self) -> None:
+        denied_context = dict(CONTEXT, action="drop_database")
+
+        allowed, denied = await asyncio.gather(
+            self._request(_asgi_scope(CONTEXT)), self._request(_asgi_scope(denied_context))
+        )
+
+        self.assertEqual(allowed[0]["status"], 200)
+        self.assertEqual(self.seen[0][SCOPE_KEY].reason_code, "OK")
+        self.assertEqual(denied[0]["status"], 403)
+        self.assertEqual(json.loads(denied[1]["body"])["reason_code"], "DR_MISMATCH")
+
+    async def test_requests_without_context_or_drc_are_denied(self) -> None:
+        no_drc = await self._request(_asgi_scope(dict(CONTEXT, scope="other.prod")))
+        no_context = await self._request(_asgi_scope({}))
+        await self._request({"type": "lifespan"})
+
+        for messages in (no_drc, no_context):
+            self.assertEqual(messages[0]["status"], 403)
+            self.assertEqual(json.loads(messages[1]["body"])["reason_code"], "INVALID_DRC_SCHEMA")
+        self.assertEqual([scope["type"] for scope in self.seen], ["lifespan"])
+
+    async def test_bypass_is_explicit_opt_in(self) -> None:
+        self.middleware = EnforcementMiddleware(
+            self.middleware.app,
+            artifacts=ARTIFACTS,
+            drc_for=_drc_for,
+            bypass=lambda scope: scope.get("path") == "/healthz",
+        )
+
+        health = await self._request(dict(_asgi_scope({}), path="/healthz"))
+        other = await self._request(_asgi_scope({}))
+
+        self.assertEqual((health[0]["status"], other[0]["status"]), (200, 403))
+        self.assertNotIn(SCOPE_KEY, self.seen[0])
+
+    async def test_denied_websocket_is_closed(self) -> None:
+        scope = dict(_asgi_scope(dict(CONTEXT, action="drop_database")), type="websocket")
+
+        messages = await self._request(scope)
+
+        self.assertEqual(messages, [{"type": "websocket.close", "code": 1008}])
+        self.assertEqual(self.seen, [])
+
+
+class WSGIEnforcementMiddlewareTests(unittest.TestCase):
+    def test_allows_and_denies(self) -> None:
+        def app(environ: dict, start_response) -> list[bytes]:
+            start_response("200 OK", [])
+            return [environ[SCOPE_KEY].reason_code.encode("latin-1")]
+
+        middleware = WSGIEnforcementMiddleware(app, artifacts=ARTIFACTS, drc_for=_drc_for)
+        statuses: list[str] = []
+
+        def start_response(status: str, headers: list) -> None:
+            statuses.append(status)
+
+        def environ(context: dict) -> dict:
+            return {f"HTTP_X_GTAF_{key.upper()}": value for key, value in context.items()}
+
+        allowed = middleware(environ(CONTEXT), start_response)
+        denied = middleware(environ(dict(CONTEXT, component="rogue.agent")), start_response)
+
+        missing = middleware({}, start_response)
+
+        self.assertEqual(allowed, [b"OK"])
+        self.assertEqual(json.loads(denied[0])["reason_code"], "OUTSIDE_SB")
+        self.assertEqual(json.loads(missing[0])["reason_code"], "INVALID_DRC_SCHEMA")
+        self.assertEqual(statuses, ["200 OK", "403 Forbidden", "403 Forbidden"])
+
+
+if __name__ == "__main__":
+    unittest.main()
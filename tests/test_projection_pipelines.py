@@ -0,0 +1,59 @@
+import importlib
+import unittest
+from unittest import mock
+
+from gtaf_runtime import ProjectionPipeline, enforce, get_supported_projection_versions, register_projection_pipeline
+
+try:
+    from tests._fixture_paths import load_case
+except ModuleNotFoundError:
+    from _fixture_paths import load_case
+
+
+# `gtaf_runtime.enforce` resolves to the function alias, so import the module explicitly.
+enforce_module = importlib.import_module("gtaf_runtime.enforce")
+
+
+class ProjectionPipelineRegistryTests(unittest.TestCase):
+    def test_projection_v01_uses_frozen_check(self) -> None:
+        pipeline = enforce_module._PIPELINES["0.1"]
+
+        self.assertIs(pipeline.check, enforce_module._check_projection_v0_1)
+
+    def test_registered_version_cannot_be_replaced(self) -> None:
+        with self.assertRaises(ValueError):
+            register_projection_pipeline(ProjectionPipeline(version="0.1", check=lambda *args: None))
+
+    def test_registry_is_read_only(self) -> None:
+        with self.assertRaises(TypeError):
+            enforce_module._PIPELINES["0.2"] = enforce_module._PIPELINES["0.1"]
+
+    def test_new_version_plugs_in_via_registry(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        drc["gtaf_ref"]["version"] = "0.2"
+
+        def deny_everything(*args: object) -> str:
+            return "DR_MISMATCH"
+
+        with mock.patch.object(enforce_module, "_PIPELINES", enforce_module._PIPELINES):
+            register_projection_pipeline(ProjectionPipeline(version="0.2", check=deny_everything))
+
+            self.assertEqual(get_supported_projection_versions(), {"0.1", "0.2"})
+            self.assertEqual(enforce(drc, context, artifacts, now=now).reason_code, "DR_MISMATCH")
+            drc["gtaf_ref"]["version"] = "0.1"
+            self.assertEqual(enforce(drc, context, artifacts, now=now).reason_code, "OK")
+
+        drc["gtaf_ref"]["version"] = "0.2"
+        self.assertEqual(enforce(drc, context, artifacts, now=now).reason_code, "UNSUPPORTED_GTAF_VERSION")
+
+    def test_explicit_supported_version_without_pipeline_uses_v01(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        drc["gtaf_ref"]["version"] = "0.2"
+
+        result = enforce(drc, context, artifacts, supported_versions={"0.2"}, now=now)
+
+        self.assertEqual(result.reason_code, "OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+import functools
+import importlib
+import json
+import subprocess
+import sys
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from gtaf_runtime import (
+    ConsistentHashRouter,
+    ProjectionPipeline,
+    ShardedEnforcer,
+    enforce,
+    register_projection_pipeline,
+    shard_artifacts,
+)
+
+try:
+    from tests._fixture_paths import CASE_DIRS, load_case
+except ModuleNotFoundError:
+    from _fixture_paths import CASE_DIRS, load_case
+
+SHARDS = ["shard-a", "shard-b", "shard-c"]
+
+
+class _SlowNow(datetime):
+    """Stalls the shard worker in the DRC window check (sent to the worker by pickle)."""
+
+    def __ge__(self, other: object) -> bool:
+        time.sleep(0.6)
+        return super().__ge__(other)
+
+
+def _deny_as_dr_mismatch(*args: object) -> str:
+    return "DR_MISMATCH"
+
+
+def _allow_everything(*args: object) -> None:
+    return None
+
+
+def _scopes_on(router: ConsistentHashRouter, shard_id: str, count: int = 2) -> list[str]:
+    scopes = [f"tenant-{index}.prod" for index in range(1000)]
+    return [scope for scope in scopes if router.shard_for(scope) == shard_id][:count]
+
+
+class ConsistentHashRouterTests(unittest.TestCase):
+    def test_assignment_is_deterministic_and_balanced(self) -> None:
+        router = ConsistentHashRouter(SHARDS)
+        scopes = [f"tenant-{index}.prod" for index in range(3000)]
+
+        assignment = [router.shard_for(scope) for scope in scopes]
+
+        self.assertEqual(assignment, [ConsistentHashRouter(SHARDS).shard_for(scope) for scope in scopes])
+        for shard_id in SHARDS:
+            self.assertGreater(assignment.count(shard_id), 500)
+
+    def test_adding_a_shard_moves_only_its_share_of_scopes(self) -> None:
+        scopes = [f"tenant-{index}.prod" for index in range(3000)]
+        before = ConsistentHashRouter(SHARDS)
+        after = ConsistentHashRouter([*SHARDS, "shard-d"])
+
+        moved = [scope for scope in scopes if before.shard_for(scope) != after.shard_for(scope)]
+
+        self.assertTrue(all(after.shard_for(scope) == "shard-d" for scope in moved))
+        self.assertLess(len(moved), len(scopes) // 2)
+
+    def test_duplicate_or_missing_shards_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            ConsistentHashRouter([])
+        with self.assertRaises(ValueError):
+            ConsistentHashRouter(["a", "a"])
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_package_import_does_not_load_multiprocessing(self) -> None:
+        code = (
+            "import sys, gtaf_runtime; assert 'multiprocessing' not in sys.modules; "
+            "from gtaf_runtime import ShardedEnforcer; assert 'multiprocessing' in sys.modules"
+        )
+        root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+class ShardArtifactsTests(unittest.TestCase):
+    def test_linked_scopes_pull_artifacts_into_shard(self) -> None:
+        router = ConsistentHashRouter(SHARDS)
+        home, other = _scopes_on(router, "shard-a", 1)[0], _scopes_on(router, "shard-b", 1)[0]
+        artifacts = {
+            "SB-HOME": {"scope": home, "included_components": ["x"], "valid_from": "a", "valid_until": "b"},
+            "DR-LINKED": {"scope": other, "linked_scopes": [home], "decisions": ["act"]},
+            "RB-OTHER": {"scope": other, "active": True, "valid_from": "a", "valid_until": "b"},
+        }
+
+        local = shard_artifacts(artifacts, "shard-a", router)
+
+        self.assertIs(local["SB-HOME"], artifacts["SB-HOME"])
+        self.assertIs(local["DR-LINKED"], artifacts["DR-LINKED"])
+        self.assertEqual(local["RB-OTHER"], {"valid_from": "a", "valid_until": "b"})
+        self.assertIsNone(local.get("RB-MISSING"))
+        self.assertEqual(set(local), set(artifacts))
+
+    def test_remote_ids_share_window_records(self) -> None:
+        router = ConsistentHashRouter(SHARDS)
+        other = _scopes_on(router, "shard-b", 1)[0]
+        window = {"valid_from": "2026-01-01T00:00:00Z", "valid_until": "2027-01-01T00:00:00Z"}
+        pairs = ((f"RB-{index}", json.loads(json.dumps({"scope": other, **window}))) for index in range(100))
+
+        local = shard_artifacts(pairs, "shard-a", router)
+
+        self.assertEqual(len(local), 100)
+        self.assertEqual(local["RB-7"], window)
+        self.assertEqual(len({id(record) for record in local._windows.values()}), 1)
+
+
+class ShardedEnforcerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.router = ConsistentHashRouter(SHARDS)
+        cls.cases = [load_case(case_name) for case_name in CASE_DIRS]
+        cls.artifacts: dict = {}
+        for _, artifacts, _, _ in cls.cases:
+            cls.artifacts.update(artifacts)
+        cls.enforcer = ShardedEnforcer(cls.artifacts, SHARDS)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.enforcer.close()
+
+    def _assert_same_as_single_node(self, drc: dict, context: dict, artifacts: dict, now: datetime) -> None:
+        self.assertEqual(self.enforcer.enforce(drc, context, now=now), enforce(drc, context, artifacts, now=now))
+
+    def test_fixture_matrix_matches_single_node(self) -> None:
+        for case_name, (drc, _, context, now) in zip(CASE_DIRS, self.cases):
+            with self.subTest(case=case_name):
+                self._assert_same_as_single_node(drc, context, self.artifacts, now)
+
+    def test_cross_scope_reference_keeps_single_node_reason(self) -> None:
+        drc, _, context, now = load_case("happy_execute")
+        for scope in [*_scopes_on(self.router, "shard-a"), *_scopes_on(self.router, "shard-b")]:
+            with self.subTest(scope=scope):
+                drc["scope"] = context["scope"] = scope
+                self._assert_same_as_single_node(drc, context, self.artifacts, now)
+
+    def test_linked_scope_executes_on_owning_shard(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        linked = [_scopes_on(self.router, shard_id, 1)[0] for shard_id in SHARDS]
+        linked_artifacts = {key: dict(item, linked_scopes=linked) for key, item in artifacts.items()}
+
+        with ShardedEnforcer(linked_artifacts, SHARDS) as enforcer:
+            for scope in linked:
+                with self.subTest(scope=scope):
+                    drc["scope"] = context["scope"] = scope
+                    result = enforcer.enforce(drc, context, now=now)
+
+                    self.assertEqual(result.outcome, "EXECUTE")
+                    self.assertEqual(result, enforce(drc, context, linked_artifacts, now=now))
+
+    def test_workers_can_load_their_own_share(self) -> None:
+        source = functools.partial(json.loads, json.dumps(self.artifacts))
+
+        with ShardedEnforcer(source, SHARDS) as enforcer:
+            for case_name, (drc, _, context, now) in zip(CASE_DIRS, self.cases):
+                with self.subTest(case=case_name):
+                    expected = enforce(drc, context, self.artifacts, now=now)
+                    self.assertEqual(enforcer.enforce(drc, context, now=now), expected)
+
+    def test_failing_source_is_reported(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, "failed to load artifacts"):
+            ShardedEnforcer(functools.partial(json.loads, "not json"), SHARDS[:1])
+
+    def test_unsendable_request_denies(self) -> None:
+        drc, _, context, now = load_case("happy_execute")
+
+        result = self.enforcer.enforce(drc, dict(context, extra=lambda: None), now=now)
+
+        self.assertEqual((result.outcome, result.reason_code), ("DENY", "INTERNAL_ERROR"))
+        self._assert_same_as_single_node(drc, context, self.artifacts, now)
+
+    def test_registered_pipelines_reach_the_workers(self) -> None:
+        drc, _, context, now = load_case("happy_execute")
+        enforce_module = importlib.import_module("gtaf_runtime.enforce")
+
+        with mock.patch.object(enforce_module, "_PIPELINES", enforce_module._PIPELINES):
+            register_projection_pipeline(ProjectionPipeline(version="0.2", check=_deny_as_dr_mismatch))
+            with ShardedEnforcer(self.artifacts, SHARDS[:2]) as enforcer:
+                register_projection_pipeline(ProjectionPipeline(version="0.3", check=_allow_everything))
+                expectations = {"0.2": "DR_MISMATCH", "0.3": "OK", "0.4": "UNSUPPORTED_GTAF_VERSION"}
+                for version, reason_code in expectations.items():
+                    with self.subTest(version=version):
+                        request = dict(drc, gtaf_ref={"version": version})
+                        expected = enforce(request, context, self.artifacts, now=now)
+
+                        self.assertEqual(expected.reason_code, reason_code)
+                        self.assertEqual(enforcer.enforce(request, context, now=now), expected)
+
+    def test_hung_shard_denies_and_late_reply_is_dropped(self) -> None:
+        drc, _, context, now = load_case("happy_execute")
+        blocked = dict(drc, result="NOT_PERMITTED")
+
+        with ShardedEnforcer(self.artifacts, SHARDS[:1], timeout=0.2) as enforcer:
+            result = enforcer.enforce(blocked, context, now=_SlowNow.fromtimestamp(now.timestamp(), now.tzinfo))
+            self.assertEqual(result.reason_code, "INTERNAL_ERROR")
+            time.sleep(1.0)
+
+            self.assertEqual(enforcer.enforce(drc, context, now=now), enforce(drc, context, self.artifacts, now=now))
+
+
+if __name__ == "__main__":
+    unittest.main()
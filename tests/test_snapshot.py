@@ -0,0 +1,216 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from gtaf_runtime import (
+    ArtifactDirectoryLoader,
+    ArtifactInterner,
+    CompactArtifact,
+    apply_patch,
+    compact_artifacts,
+    diff_snapshots,
+    enforce,
+    snapshot_hash,
+)
+
+try:
+    from tests._fixture_paths import load_case
+except ModuleNotFoundError:
+    from _fixture_paths import load_case
+
+
+def _write_json(path: Path, payload: dict, mtime_ns: int) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class ArtifactDirectoryLoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _, artifacts, _, _ = load_case("happy_execute")
+        for artifact_id, artifact in artifacts.items():
+            _write_json(self.root / f"{artifact_id}.json", {artifact_id: artifact}, 1_000_000_000)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_initial_snapshot_is_enforceable(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        drc, _, context, now = load_case("happy_execute")
+
+        result = enforce(drc, context, loader.snapshot.artifacts, now=now)
+
+        self.assertEqual(loader.snapshot.generation, 1)
+        self.assertEqual(result.outcome, "EXECUTE")
+        with self.assertRaises(TypeError):
+            loader.snapshot.artifacts["RB-FX-001"] = {}
+
+    def test_interner_compacts_each_file_on_load(self) -> None:
+        interner = ArtifactInterner()
+        loader = ArtifactDirectoryLoader(self.root, interner=interner)
+        drc, artifacts, context, now = load_case("happy_execute")
+        before = loader.snapshot
+
+        self.assertTrue(all(isinstance(item, CompactArtifact) for item in before.artifacts.values()))
+        self.assertEqual(enforce(drc, context, before.artifacts, now=now), enforce(drc, context, artifacts, now=now))
+
+        rb = dict(artifacts["RB-FX-001"], active=False)
+        _write_json(self.root / "RB-FX-001.json", {"RB-FX-001": rb}, 2_000_000_000)
+        self.assertTrue(loader.refresh())
+        after = loader.snapshot.artifacts
+        self.assertIsInstance(after["RB-FX-001"], CompactArtifact)
+        self.assertIs(after["RB-FX-001"].get("scope"), after["SB-FX-001"].get("scope"))
+
+    def test_refresh_without_changes_keeps_snapshot(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        before = loader.snapshot
+
+        self.assertFalse(loader.refresh())
+        self.assertIs(loader.snapshot, before)
+
+    def test_refresh_reparses_only_changed_files(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        before = loader.snapshot
+        rb = dict(before.artifacts["RB-FX-001"], active=False)
+        _write_json(self.root / "RB-FX-001.json", {"RB-FX-001": rb}, 2_000_000_000)
+
+        self.assertTrue(loader.refresh())
+
+        after = loader.snapshot
+        self.assertEqual(after.generation, 2)
+        self.assertFalse(after.artifacts["RB-FX-001"]["active"])
+        self.assertTrue(before.artifacts["RB-FX-001"]["active"])
+        self.assertIs(after.artifacts["SB-FX-001"], before.artifacts["SB-FX-001"])
+
+    def test_removed_file_drops_artifacts(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        (self.root / "RB-FX-001.json").unlink()
+
+        self.assertTrue(loader.refresh())
+        self.assertNotIn("RB-FX-001", loader.snapshot.artifacts)
+
+    def test_invalid_file_keeps_previous_snapshot(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        before = loader.snapshot
+        (self.root / "broken.json").write_text("{", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            loader.refresh()
+        self.assertIs(loader.snapshot, before)
+
+    def test_duplicate_artifact_id_is_rejected(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root)
+        before = loader.snapshot
+        _write_json(self.root / "dup.json", {"SB-FX-001": {}}, 1_000_000_000)
+
+        with self.assertRaises(ValueError):
+            loader.refresh()
+        self.assertIs(loader.snapshot, before)
+
+    def test_missing_directory_is_an_error(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            ArtifactDirectoryLoader(self.root / "missing")
+        with self.assertRaises(NotADirectoryError):
+            ArtifactDirectoryLoader(self.root / "SB-FX-001.json")
+
+        loader = ArtifactDirectoryLoader(self.root)
+        before = loader.snapshot
+        self._tmp.cleanup()
+        with self.assertRaises(FileNotFoundError):
+            loader.refresh()
+        self.assertIs(loader.snapshot, before)
+
+    def test_content_hash_mode_ignores_touch_without_change(self) -> None:
+        loader = ArtifactDirectoryLoader(self.root, use_content_hash=True)
+        before = loader.snapshot
+        os.utime(self.root / "SB-FX-001.json", ns=(3_000_000_000, 3_000_000_000))
+
+        self.assertFalse(loader.refresh())
+        self.assertIs(loader.snapshot, before)
+
+
+class SnapshotPatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _, self.base, _, _ = load_case("happy_execute")
+
+    def test_field_change_produces_minimal_patch(self) -> None:
+        target = dict(self.base, **{"RB-FX-001": dict(self.base["RB-FX-001"], active=False)})
+
+        patch = diff_snapshots(self.base, target)
+
+        self.assertEqual(patch["update"], {"RB-FX-001": {"set": {"active": False}, "unset": []}})
+        self.assertEqual(patch["put"], {})
+        self.assertEqual(patch["remove"], [])
+        self.assertEqual(patch["base_hash"], snapshot_hash(self.base))
+        self.assertEqual(patch["target_hash"], snapshot_hash(target))
+
+    def test_apply_round_trips_through_json(self) -> None:
+        target = {key: value for key, value in self.base.items() if key != "SB-FX-001"}
+        target["RB-FX-002"] = dict(self.base["RB-FX-001"], id="RB-FX-002")
+        dr = dict(self.base["DR-FX-001"])
+        dr.pop(next(iter(dr)))
+        target["DR-FX-001"] = dr
+
+        patch = json.loads(json.dumps(diff_snapshots(self.base, target)))
+        result = apply_patch(self.base, patch)
+
+        self.assertEqual(result, target)
+        self.assertIs(result["RB-FX-001"], self.base["RB-FX-001"])
+        self.assertEqual(apply_patch(self.base, patch, base_hash=patch["base_hash"]), target)
+
+    def test_compact_artifacts_hash_and_diff_like_dicts(self) -> None:
+        compact = compact_artifacts(self.base)
+        target = compact_artifacts(dict(self.base, **{"RB-FX-001": dict(self.base["RB-FX-001"], active=False)}))
+        target["RB-FX-002"] = target["RB-FX-001"]
+
+        self.assertEqual(snapshot_hash(compact), snapshot_hash(self.base))
+        patch = json.loads(json.dumps(diff_snapshots(compact, target)))
+        self.assertEqual(patch["update"], {"RB-FX-001": {"set": {"active": False}, "unset": []}})
+        self.assertEqual(list(patch["put"]), ["RB-FX-002"])
+        self.assertEqual(apply_patch(compact, patch), target)
+
+    def test_hash_is_independent_of_key_order(self) -> None:
+        reordered = {key: dict(reversed(list(value.items()))) for key, value in reversed(list(self.base.items()))}
+
+        self.assertEqual(snapshot_hash(reordered), snapshot_hash(self.base))
+        self.assertEqual(diff_snapshots(self.base, reordered)["update"], {})
+
+    def test_apply_rejects_diverged_base(self) -> None:
+        target = dict(self.base, **{"RB-FX-001": dict(self.base["RB-FX-001"], active=False)})
+        patch = diff_snapshots(self.base, target)
+        diverged = dict(self.base, **{"SB-FX-001": dict(self.base["SB-FX-001"], extra=1)})
+
+        with self.assertRaisesRegex(ValueError, "base hash"):
+            apply_patch(diverged, patch)
+
+    def test_apply_rejects_tampered_patch(self) -> None:
+        target = dict(self.base, **{"RB-FX-001": dict(self.base["RB-FX-001"], active=False)})
+        patch = diff_snapshots(self.base, target)
+        patch["update"]["RB-FX-001"]["set"]["active"] = True
+
+        with self.assertRaisesRegex(ValueError, "target hash"):
+            apply_patch(self.base, patch)
+
+    def test_apply_rejects_malformed_patch(self) -> None:
+        target = dict(self.base, **{"RB-FX-001": dict(self.base["RB-FX-001"], active=False)})
+        patch = diff_snapshots(self.base, target)
+        malformed = [
+            None,
+            {key: value for key, value in patch.items() if key != "remove"},
+            dict(patch, update=[]),
+            dict(patch, update={"RB-FX-001": {"set": ["active"], "unset": []}}),
+            dict(patch, update={"RB-FX-001": {"set": {}}}),
+            dict(patch, put={"RB-FX-002": {}, 3: {}}),
+            dict(patch, remove="RB-FX-001"),
+            dict(patch, base_hash=None),
+        ]
+        for bad in malformed:
+            with self.subTest(patch=bad), self.assertRaises(ValueError):
+                apply_patch(self.base, bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from dataclasses import replace
+
+from gtaf_runtime import enforce, wire
+from gtaf_runtime.wire import request_from_bytes, request_to_bytes, result_from_bytes, result_to_bytes
+
+try:
+    from tests._fixture_paths import CASE_DIRS, load_case
+except ModuleNotFoundError:
+    from _fixture_paths import CASE_DIRS, load_case
+
+
+class WireCodecTests(unittest.TestCase):
+    def test_fixture_results_round_trip(self) -> None:
+        for case_name in CASE_DIRS:
+            with self.subTest(case=case_name):
+                drc, artifacts, context, now = load_case(case_name)
+                result = enforce(drc, context, artifacts, now=now)
+
+                self.assertEqual(result_from_bytes(result_to_bytes(result)), result)
+
+    def test_fixture_requests_round_trip(self) -> None:
+        for case_name in CASE_DIRS:
+            with self.subTest(case=case_name):
+                drc, _, context, _ = load_case(case_name)
+
+                self.assertEqual(request_from_bytes(request_to_bytes(drc, context)), (drc, context))
+
+    def test_result_with_unlisted_reason_and_untyped_fields_round_trips(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        result = replace(
+            enforce(drc, context, artifacts, now=now),
+            reason_code="CUSTOM_REASON",
+            revision=True,
+            drc_id=None,
+            details={"score": 0.5, "big": 2**70, "nested": [None, False, {"k": "v"}]},
+        )
+
+        self.assertEqual(result_from_bytes(result_to_bytes(result)), result)
+
+    def test_decode_from_memoryview_slice(self) -> None:
+        drc, artifacts, context, now = load_case("deny_scope_leak")
+        result = enforce(drc, context, artifacts, now=now)
+        frame = result_to_bytes(result)
+        buffer = bytearray(b"\x00" * 7 + frame + b"\x00" * 3)
+
+        decoded = result_from_bytes(memoryview(buffer)[7 : 7 + len(frame)])
+
+        self.assertEqual(decoded, result)
+
+    def test_malformed_frames_raise_value_error(self) -> None:
+        drc, artifacts, context, now = load_case("happy_execute")
+        frame = result_to_bytes(enforce(drc, context, artifacts, now=now))
+
+        for label, data in {
+            "bad_magic": b"XX" + frame[2:],
+            "truncated": frame[:-1],
+            "trailing": frame + b"\x00",
+            "wrong_kind": request_to_bytes(drc, context),
+        }.items():
+            with self.subTest(case=label):
+                with self.assertRaises(ValueError):
+                    result_from_bytes(data)
+
+    def test_request_fast_path_matches_generic_codec(self) -> None:
+        drc, _, context, _ = load_case("happy_execute")
+        variants = {
+            "projection": (drc, context),
+            "non_ascii": (dict(drc, scope="ops.prød"), dict(context, scope="ops.prød")),
+            "partial_context": (drc, {"action": "restart_worker", "scope": "ops.prod"}),
+            "extra_drc_key": (dict(drc, note="x"), context),
+            "extra_context_key": (drc, dict(context, tenant="t")),
+            "int_ref": (dict(drc, refs=dict(drc["refs"], rb=[1])), context),
+        }
+        for label, (request_drc, request_context) in variants.items():
+            with self.subTest(case=label):
+                encoder = wire._Encoder()
+                encoder.drc(request_drc)
+                encoder.context(request_context)
+                frame = request_to_bytes(request_drc, request_context)
+
+                self.assertEqual(frame, encoder.finish(wire._KIND_REQUEST))
+                self.assertEqual(request_from_bytes(frame), (request_drc, request_context))
+
+    def test_malformed_request_frames_raise_value_error(self) -> None:
+        drc, _, context, _ = load_case("happy_execute")
+        frame = request_to_bytes(drc, context)
+
+        for label, data in {
+            "truncated": frame[:-1],
+            "trailing": frame + b"\x00",
+            "bad_field": frame[:-2] + b"\x09\x00",
+        }.items():
+            with self.subTest(case=label):
+                with self.assertRaises(ValueError):
+                    request_from_bytes(data)
+
+    def test_unsupported_values_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            request_to_bytes({"id": object()}, {})
+        with self.assertRaises(ValueError):
+            request_to_bytes({1: "non-string key"}, {})
+
+
+if __name__ == "__main__":
+    unittest.main()